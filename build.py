@@ -3,7 +3,9 @@
 Build script for creating the Earworm executable.
 """
 
+import shlex
 import subprocess
+import shutil
 import sys
 import os
 from pathlib import Path
@@ -18,8 +20,35 @@ def find_faster_whisper_data():
         return None
 
 
-def build():
-    """Build the executable using PyInstaller."""
+def find_upx_excludes():
+    """List binaries that must not be UPX-compressed."""
+    excludes = [
+        "vcruntime140.dll",
+        "vcruntime140_1.dll",
+        "python3.dll",
+        f"python{sys.version_info.major}{sys.version_info.minor}.dll",
+        "_ctypes.pyd",
+    ]
+
+    # ctranslate2 ships its CPU/CUDA backend DLLs alongside the package;
+    # GPU loader DLLs in particular tend to crash once UPX-packed.
+    try:
+        import ctranslate2
+        ct2_dir = Path(ctranslate2.__file__).parent
+        excludes.extend(p.name for p in ct2_dir.rglob("*.dll"))
+    except ImportError:
+        pass
+
+    return excludes
+
+
+def build(quiet: bool = False):
+    """
+    Build the executable using PyInstaller.
+
+    Args:
+        quiet: If True, don't echo the full PyInstaller command line.
+    """
     project_dir = Path(__file__).parent
     main_script = project_dir / "launcher.py"
 
@@ -28,61 +57,85 @@ def build():
     cmd = [
         sys.executable, "-m", "PyInstaller",
         "--name", "Earworm",
-        "--onefile",  # Single executable
         "--windowed",  # No console window for release
-        "--add-data", f"{project_dir / 'src'};src",
+        # Let analysis follow launcher's `from app import main` into src/.
+        # The app modules then load from the compiled PYZ archive alongside
+        # everything else, instead of being shipped as loose .py data files.
+        "--paths", str(project_dir / "src"),
     ]
 
+    # Compile bundled modules as if run with -OO: drops docstrings and
+    # asserts so there's less bytecode to read and unmarshal at startup
+    cmd.extend(["--optimize", "2"])
+
+    # Strip symbol tables from bundled extensions (no-op on Windows)
+    if sys.platform != "win32":
+        cmd.append("--strip")
+
+    # Default to a one-folder bundle: onefile re-extracts everything to a
+    # temp dir on every launch, which makes cold start much slower.
+    onefile = bool(os.environ.get("EARWORM_ONEFILE"))
+    if onefile:
+        cmd.append("--onefile")
+
     # Add icon if it exists
     if icon_path.exists():
         cmd.extend(["--icon", str(icon_path)])
 
-    # Add faster-whisper data if found
+    # Splash screen shown by the bootloader while Python starts up
+    splash_path = project_dir / "assets" / "earhole.png"
+    if splash_path.exists():
+        cmd.extend(["--splash", str(splash_path)])
+
+    # Compress bundled binaries with UPX if available (EARWORM_NOUPX=1 to skip)
+    upx = shutil.which("upx")
+    if os.environ.get("EARWORM_NOUPX"):
+        cmd.append("--noupx")
+    elif upx:
+        cmd.extend(["--upx-dir", os.path.dirname(upx)])
+        for name in find_upx_excludes():
+            cmd.extend(["--upx-exclude", name])
+
+    # Add faster-whisper data if found. Only collect what's actually loaded
+    # at runtime: the VAD model assets and the ctranslate2 native libraries.
     fw_path = find_faster_whisper_data()
     if fw_path:
-        cmd.extend(["--collect-all", "faster_whisper"])
-        cmd.extend(["--collect-all", "ctranslate2"])
-
-    # Collect all submodules for problematic packages
-    cmd.extend(["--collect-all", "tkinter"])
-    cmd.extend(["--collect-all", "PIL"])
-    cmd.extend(["--collect-all", "pynput"])
+        cmd.extend(["--collect-data", "faster_whisper"])
+        cmd.extend(["--collect-binaries", "ctranslate2"])
+
+    # pynput picks its platform backend dynamically. tkinter and PIL are
+    # handled by PyInstaller's own hooks and don't need collecting.
+    cmd.extend(["--collect-submodules", "pynput.keyboard"])
+    cmd.extend(["--collect-submodules", "pynput.mouse"])
+
+    # Heavy modules that dependencies may drag in but are never needed at runtime
+    excludes = [
+        # Plotting/science stacks
+        "matplotlib", "scipy", "pandas",
+        # Dev and packaging tooling
+        "pytest", "setuptools", "pkg_resources", "docutils", "sphinx",
+        "IPython", "notebook", "jupyter",
+        # Other GUI toolkits
+        "PyQt5", "PyQt6", "PySide2", "PySide6", "wx",
+        # Test suites and doc data
+        "tkinter.test", "test", "tests", "unittest", "pydoc_data",
+        "numpy.distutils", "numpy.tests",
+        # PIL viewers/bridges we don't use
+        "PIL.ImageQt", "PIL.ImageShow",
+    ]
+    for module in excludes:
+        cmd.extend(["--exclude-module", module])
 
-    # Hidden imports that PyInstaller might miss
+    # Hidden imports that PyInstaller might miss. Everything else (stdlib,
+    # numpy, PIL, tkinter) is found by static analysis or PyInstaller hooks.
     hidden_imports = [
         # pynput platform-specific
         "pynput.keyboard._win32",
         "pynput.mouse._win32",
         # Audio
         "sounddevice",
-        "wave",
-        # Data/ML
-        "numpy",
-        "PIL",
-        "PIL.Image",
-        "PIL.ImageDraw",
-        "PIL.ImageTk",
-        # Tkinter and submodules
-        "tkinter",
-        "tkinter.ttk",
-        "tkinter.font",
-        "tkinter.messagebox",
-        "tkinter.filedialog",
+        # Tkinter C extension
         "_tkinter",
-        # Standard library that might be missed
-        "queue",
-        "tempfile",
-        "json",
-        "pathlib",
-        "typing",
-        "re",
-        "dataclasses",
-        "enum",
-        "abc",
-        "math",
-        "threading",
-        "time",
-        "os",
     ]
 
     for imp in hidden_imports:
@@ -92,18 +145,73 @@ def build():
     cmd.append(str(main_script))
 
     print("Building Earworm executable...")
-    print(f"Command: {' '.join(cmd)}")
+    if not quiet:
+        print(f"Command: {shlex.join(cmd)}")
 
-    # Run PyInstaller
-    result = subprocess.run(cmd, cwd=project_dir)
+    # Run PyInstaller (output streams straight to the console)
+    result = subprocess.run(cmd, cwd=project_dir, check=False)
 
     if result.returncode == 0:
         print("\nBuild successful!")
-        print(f"Executable: {project_dir / 'dist' / 'Earworm.exe'}")
+        if onefile:
+            print(f"Executable: {project_dir / 'dist' / 'Earworm.exe'}")
+        else:
+            print(f"Executable: {project_dir / 'dist' / 'Earworm' / 'Earworm.exe'}")
+            print("Ship the whole dist/Earworm folder, not just the .exe.")
     else:
         print("\nBuild failed!")
         sys.exit(1)
 
 
+def profile():
+    """Record per-module import times for the app with `-X importtime`."""
+    project_dir = Path(__file__).parent
+    log_path = project_dir / "import.log"
+
+    # Go through launcher.py's own path setup and import, then do the
+    # importing part of startup without starting the app: constructing
+    # STTApp pulls in the component modules (numpy, pynput, tkinter, PIL),
+    # and start() preloads the model, which imports faster_whisper
+    script = "\n".join([
+        "import launcher",
+        "launcher._setup_path()",
+        "from app import main, STTApp",
+        "STTApp()",
+        "import faster_whisper",
+    ])
+
+    print("Profiling Earworm imports...")
+    with open(log_path, 'w') as f:
+        subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", script],
+            stderr=f,
+            cwd=project_dir
+        )
+
+    tuna = shutil.which("tuna")
+    if tuna:
+        subprocess.run([tuna, str(log_path)])
+    else:
+        print(f"Wrote {log_path}; install 'tuna' for a flamegraph.")
+
+
 if __name__ == "__main__":
-    build()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the Earworm executable")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile app import times instead of building"
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Don't print the PyInstaller command line"
+    )
+    args = parser.parse_args()
+
+    if args.profile:
+        profile()
+    else:
+        build(quiet=args.quiet)
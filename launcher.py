@@ -7,20 +7,32 @@ This allows PyInstaller to properly handle the package imports.
 import sys
 import os
 
-# Ensure src directory is in path for imports
-if getattr(sys, 'frozen', False):
-    # Running as compiled exe
-    base_path = sys._MEIPASS
-else:
-    # Running as script
-    base_path = os.path.dirname(os.path.abspath(__file__))
 
-src_path = os.path.join(base_path, 'src')
-if src_path not in sys.path:
-    sys.path.insert(0, src_path)
+def _setup_path() -> None:
+    """Ensure src directory is in path for imports when running from source."""
+    if getattr(sys, 'frozen', False):
+        # Compiled exe: the app modules are bundled into the archive (built
+        # with --paths src), so there is no src directory to add
+        return
+
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    src_path = os.path.join(base_path, 'src')
+    if src_path not in sys.path:
+        sys.path.insert(0, src_path)
 
-# Now import and run using absolute imports
-from app import main
 
 if __name__ == "__main__":
+    _setup_path()
+
+    # Imported only once the path is set up, so merely importing this module
+    # (PyInstaller analysis, IDE indexers) doesn't pull in the whole app.
+    from app import main
+
+    # Imports are done; drop the bootloader splash screen if there is one
+    try:
+        import pyi_splash
+        pyi_splash.close()
+    except ImportError:
+        pass
+
     main()
@@ -5,60 +5,34 @@
 # - Voice command processing (punctuation, formatting, editing)
 # - Smart punctuation restoration
 # - Preview window for text review before pasting
+#
+# This is a thin shim: only `main` and `__version__` are part of the package
+# surface. The rest of the public API lives in `_public` and is only loaded
+# when one of those names is actually requested.
 
-from .app import STTApp, Config, main
-from .audio_recorder import AudioRecorder, cleanup_temp_file
-from .transcriber import Transcriber, ModelSize
-from .keyboard_typer import KeyboardTyper
-from .hotkey_manager import HotkeyManager, PushToTalkManager
-from .gui import StatusWindow
-from .text_processor import (
-    TextProcessingPipeline,
-    VoiceCommandProcessor,
-    SmartPunctuator,
-    VoiceCommand,
-    CommandAction,
-    CommandResult,
-    process_transcription,
-)
-from .preview_window import (
-    PreviewWindow,
-    PreviewManager,
-    PreviewWindowConfig,
-    PreviewResult,
-    PreviewAction,
-)
+from ._importtools import cached_import as _cached_import
 
 __version__ = "2.0.0"
-__all__ = [
-    # Main app
-    "STTApp",
-    "Config",
-    "main",
-    # Audio
-    "AudioRecorder",
-    "cleanup_temp_file",
-    # Transcription
-    "Transcriber",
-    "ModelSize",
-    # Input
-    "KeyboardTyper",
-    "HotkeyManager",
-    "PushToTalkManager",
-    # GUI
-    "StatusWindow",
-    # Text processing
-    "TextProcessingPipeline",
-    "VoiceCommandProcessor",
-    "SmartPunctuator",
-    "VoiceCommand",
-    "CommandAction",
-    "CommandResult",
-    "process_transcription",
-    # Preview
-    "PreviewWindow",
-    "PreviewManager",
-    "PreviewWindowConfig",
-    "PreviewResult",
-    "PreviewAction",
-]
+__all__ = ("main", "__version__")
+
+
+def __getattr__(name):
+    if name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if name == "main":
+        value = _cached_import(f"{__name__}.app", "main")
+    else:
+        # Check the catalog here so a miss names this package, not _public
+        if name not in _cached_import(f"{__name__}._public", "__all__"):
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = _cached_import(f"{__name__}._public", name)
+
+    # Cache so later lookups bypass __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    public_names = _cached_import(f"{__name__}._public", "__all__")
+    return sorted(set(globals()) | set(public_names))
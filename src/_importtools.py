@@ -0,0 +1,22 @@
+# Import helpers shared by the lazy package modules.
+
+import sys
+from importlib import import_module
+
+
+def cached_import(module_name: str, item_name: str):
+    """
+    Return `item_name` from `module_name`, importing the module if needed.
+
+    Checks sys.modules first so repeated lookups skip the import machinery.
+    A module whose body is still running has a spec flagged `_initializing`;
+    that case goes through import_module, which waits on the import lock
+    when another thread is mid-import instead of handing back a half-built
+    module.
+    """
+    module = sys.modules.get(module_name)
+    if module is None or getattr(
+        getattr(module, "__spec__", None), "_initializing", False
+    ):
+        module = import_module(module_name)
+    return getattr(module, item_name)
@@ -0,0 +1,60 @@
+# Earworm - full public API
+#
+# Catalog of every public name and the submodule that defines it. Names are
+# resolved lazily (PEP 562) so only the submodule actually needed gets
+# imported. The package __init__ forwards anything other than `main` here.
+
+from ._importtools import cached_import
+
+# Attribute name -> submodule that defines it
+_LAZY = {
+    # Main app
+    "STTApp": "app",
+    "Config": "app",
+    "main": "app",
+    # Audio
+    "AudioRecorder": "audio_recorder",
+    "cleanup_temp_file": "audio_recorder",
+    # Transcription
+    "Transcriber": "transcriber",
+    "ModelSize": "transcriber",
+    # Input
+    "KeyboardTyper": "keyboard_typer",
+    "HotkeyManager": "hotkey_manager",
+    "PushToTalkManager": "hotkey_manager",
+    # GUI
+    "StatusWindow": "gui",
+    # Text processing
+    "TextProcessingPipeline": "text_processor",
+    "VoiceCommandProcessor": "text_processor",
+    "SmartPunctuator": "text_processor",
+    "VoiceCommand": "text_processor",
+    "CommandAction": "text_processor",
+    "CommandResult": "text_processor",
+    "process_transcription": "text_processor",
+    # Preview
+    "PreviewWindow": "preview_window",
+    "PreviewManager": "preview_window",
+    "PreviewWindowConfig": "preview_window",
+    "PreviewResult": "preview_window",
+    "PreviewAction": "preview_window",
+}
+
+# Star-imports defeat the lazy loading (they resolve every name); import the
+# names you need explicitly instead.
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = cached_import(f"{__package__}.{module_name}", name)
+    # Cache so later lookups bypass __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
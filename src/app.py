@@ -4,22 +4,77 @@ Coordinates all components: recording, transcription, text processing, preview,
 """
 
 import threading
-import time
+import queue
 import os
 import json
+import atexit
+import logging
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, TYPE_CHECKING
+
+# Components are imported where they are first used: the core ones in
+# STTApp.__init__ (so Config and argument parsing, e.g. --help, don't load
+# numpy, PortAudio, pynput or Tk), the preview window and streaming
+# pipeline only once those features are actually used
+if TYPE_CHECKING:
+    from text_processor import TextProcessingPipeline
+    from preview_window import PreviewManager, PreviewResult
+    from streaming_transcriber import StreamingTranscriber
+    from streaming_coordinator import StreamingCoordinator, StreamingState
+
+try:
+    import orjson  # Optional: much faster config (de)serialization
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+# Default config location in the user's app data folder, resolved once
+_DEFAULT_CONFIG_DIR = Path(os.environ.get("APPDATA", os.path.expanduser("~"))) / "Earworm"
+try:
+    _DEFAULT_CONFIG_DIR.mkdir(exist_ok=True)
+except OSError as e:
+    log.warning("Could not create config directory: %s", e)
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """
+    Send log output through a queue to a background listener thread.
+
+    Callback threads (audio, streaming, hotkeys) only enqueue records; the
+    actual console writes happen on the listener thread, so slow terminal
+    I/O can't stall them.
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+
+
+def _shorten(text: str, limit: int = 50) -> str:
+    """Cut text to `limit` characters for a notification, marking any cut."""
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "..."
+
 
-from audio_recorder import AudioRecorder, cleanup_temp_file
-from transcriber import Transcriber, ModelSize
-from keyboard_typer import KeyboardTyper
-from hotkey_manager import PushToTalkManager
-from gui import StatusWindow
-from text_processor import TextProcessingPipeline, VoiceCommandProcessor, SmartPunctuator
-from preview_window import PreviewManager, PreviewWindowConfig, PreviewResult, PreviewAction
-from streaming_transcriber import StreamingTranscriber
-from streaming_coordinator import StreamingCoordinator, StreamingState
-from pynput.keyboard import Key
+# PreviewAction name -> STTApp handler method. Keyed by name so
+# preview_window doesn't have to be imported to build the table.
+_PREVIEW_ACTIONS = {
+    "ACCEPT": "_preview_accept",
+    "COPY_ONLY": "_preview_copy",
+    "RERECORD": "_preview_rerecord",
+    "CANCEL": "_preview_cancel",
+}
 
 
 class Config:
@@ -39,6 +94,7 @@ class Config:
         "language": None,  # None = auto-detect
         "typing_delay": 0.0,
         "use_clipboard": True,
+        "preserve_clipboard": True,  # Restore the old clipboard after pasting
         "show_notifications": True,
 
         # Voice commands
@@ -68,44 +124,84 @@ class Config:
         "streaming_buffer_duration": 5.0,      # Audio context buffer size
         "streaming_agreement_threshold": 2,    # Iterations before confirming words
         "streaming_enable_corrections": True,  # Auto-correct revised words
+
+        # Opt-in: keep the microphone stream open between recordings so F9
+        # skips reopening the audio device. Off by default, so the mic is
+        # only in use while recording; each press then opens the device.
+        "keep_microphone_open": False,
     }
 
+    # Keys accepted from the config file and update()
+    _VALID_KEYS = frozenset(DEFAULT_CONFIG)
+
+    # Seconds to wait before a pending save is written to disk
+    SAVE_DELAY = 0.5
+
     def __init__(self, config_path: Optional[str] = None):
         if config_path is None:
-            # Default to user's app data folder
-            app_data = os.environ.get("APPDATA", os.path.expanduser("~"))
-            config_dir = Path(app_data) / "Earworm"
-            try:
-                config_dir.mkdir(exist_ok=True)
-            except OSError as e:
-                print(f"Warning: Could not create config directory: {e}")
-            self.config_path = config_dir / "config.json"
+            self.config_path = _DEFAULT_CONFIG_DIR / "config.json"
         else:
             self.config_path = Path(config_path)
 
         self._config = self.DEFAULT_CONFIG.copy()
+
+        # Writes are debounced: save() marks the config dirty and a short
+        # timer flushes it, so bursts of set() calls hit the disk once.
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        atexit.register(self.flush)
+
         self.load()
 
     def load(self) -> None:
         """Load configuration from file."""
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, 'r') as f:
-                    loaded = json.load(f)
-                    # Merge with defaults to handle new config options
-                    for key, value in loaded.items():
-                        if key in self.DEFAULT_CONFIG:
-                            self._config[key] = value
-            except (json.JSONDecodeError, OSError) as e:
-                print(f"Warning: Could not load config: {e}")
+        if not self.config_path.exists():
+            return
 
-    def save(self) -> None:
-        """Save configuration to file."""
         try:
-            with open(self.config_path, 'w') as f:
-                json.dump(self._config, f, indent=2)
-        except OSError as e:
-            print(f"Warning: Could not save config: {e}")
+            data = self.config_path.read_bytes()
+            loaded = orjson.loads(data) if orjson else json.loads(data)
+            # Merge with defaults to handle new config options
+            for key, value in loaded.items():
+                if key in self._VALID_KEYS:
+                    self._config[key] = value
+        except (json.JSONDecodeError, OSError) as e:
+            log.warning("Could not load config: %s", e)
+
+    def save(self) -> None:
+        """Schedule the configuration to be written to file."""
+        with self._save_lock:
+            self._dirty = True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write any pending configuration changes to file now."""
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            if not self._dirty:
+                return
+
+            try:
+                if orjson:
+                    data = orjson.dumps(self._config, option=orjson.OPT_INDENT_2)
+                else:
+                    data = json.dumps(self._config, indent=2).encode("utf-8")
+                # Write to a sibling file and swap it in, so a crash mid-write
+                # can't leave a truncated config behind
+                tmp_path = self.config_path.with_suffix('.json.tmp')
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, self.config_path)
+                self._dirty = False
+            except OSError as e:
+                log.warning("Could not save config: %s", e)
 
     def get(self, key: str, default: Any = None) -> Any:
         return self._config.get(key, default)
@@ -121,9 +217,31 @@ class Config:
     def update(self, updates: Dict[str, Any]) -> None:
         """Update multiple configuration values at once."""
         for key, value in updates.items():
-            if key in self.DEFAULT_CONFIG:
+            if key in self._VALID_KEYS:
                 self._config[key] = value
-        self.save()
+        with self._save_lock:
+            self._dirty = True
+        self.flush()
+
+
+class _ConfigView:
+    """
+    Attribute snapshot of a Config for cheap reads on hot paths.
+
+    Callbacks read `view.show_notifications` instead of going through
+    Config.get(); call refresh() whenever the underlying config changes.
+    """
+
+    __slots__ = tuple(Config.DEFAULT_CONFIG)
+
+    def __init__(self, config: Config):
+        self.refresh(config)
+
+    def refresh(self, config: Config) -> None:
+        """Re-read every known key from the config."""
+        defaults = Config.DEFAULT_CONFIG
+        for key in self.__slots__:
+            setattr(self, key, config.get(key, defaults[key]))
 
 
 class STTApp:
@@ -138,16 +256,32 @@ class STTApp:
     - Preview window for review before pasting
     """
 
+    # Recording states
+    _IDLE = 0
+    _RECORDING = 1
+    _PROCESSING = 2
+
     def __init__(self, config: Optional[Config] = None):
+        from audio_recorder import AudioRecorder
+        from transcriber import Transcriber
+        from keyboard_typer import KeyboardTyper
+        from hotkey_manager import PushToTalkManager
+        from gui import StatusWindow
+        from pynput.keyboard import Key
+
         self.config = config or Config()
+        self._cfg = _ConfigView(self.config)
 
         # Initialize core components
-        self.recorder = AudioRecorder()
+        self.recorder = AudioRecorder(
+            keep_stream_open=self._cfg.keep_microphone_open
+        )
         self.transcriber = Transcriber(
-            model_size=self.config.get("model_size", "base")
+            model_size=self._cfg.model_size
         )
         self.typer = KeyboardTyper(
-            typing_delay=self.config.get("typing_delay", 0.0)
+            typing_delay=self._cfg.typing_delay,
+            preserve_clipboard=self._cfg.preserve_clipboard
         )
 
         # Push-to-talk with F9 key
@@ -156,56 +290,111 @@ class STTApp:
 
         # Text processing pipeline
         self.text_processor = self._create_text_processor()
+        self._text_proc_active = self._is_text_proc_active()
 
-        # Preview manager (will be configured after GUI starts)
-        self.preview_manager = self._create_preview_manager()
+        # Preview manager (created on first use if preview is off at startup)
+        self.preview_manager: Optional["PreviewManager"] = None
+        if self._cfg.enable_preview:
+            self.preview_manager = self._create_preview_manager()
 
         # State
-        self._is_recording = False
-        self._processing = False
+        # Recording state: one of _IDLE, _RECORDING, _PROCESSING.
+        # Reading or assigning a single attribute is atomic under the GIL,
+        # so plain reads need no lock; _lock only guards the check-and-set
+        # transitions so two threads can't both claim the same transition.
+        self._state = self._IDLE
         self._lock = threading.Lock()
         self._running = False
+        self._stop_event = threading.Event()
 
         # For re-recording support
         self._pending_rerecord = False
 
+        # Window that had focus when the preview opened (to type into after)
+        self._target_window: Optional[int] = None
+
         # Streaming mode components (initialized after model loads)
-        self._streaming_transcriber: Optional[StreamingTranscriber] = None
-        self._streaming_coordinator: Optional[StreamingCoordinator] = None
+        self._streaming_transcriber: Optional["StreamingTranscriber"] = None
+        self._streaming_coordinator: Optional["StreamingCoordinator"] = None
         self._streaming_mode = False  # True when streaming is active
 
+        # Last tentative suffix shown in the title; most tentative updates
+        # leave it unchanged and are skipped
+        self._last_title_suffix = ""
+
+        # Persistent worker that runs post-recording processing, so releasing
+        # F9 doesn't pay for spawning a new thread every time
+        self._work_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._worker = threading.Thread(
+            target=self._work_loop,
+            daemon=True,
+            name="EarwormWorker"
+        )
+        self._worker.start()
+
         # Wire up callbacks
         self._setup_callbacks()
 
-    def _create_text_processor(self) -> TextProcessingPipeline:
-        """Create and configure the text processing pipeline."""
-        pipeline = TextProcessingPipeline(
-            enable_voice_commands=self.config.get("enable_voice_commands", True),
-            enable_smart_punctuation=self.config.get("enable_smart_punctuation", True)
+    def _work_loop(self) -> None:
+        """Run queued jobs until a None sentinel arrives."""
+        while True:
+            job = self._work_queue.get()
+            if job is None:
+                return
+            try:
+                job()
+            except Exception as e:
+                log.exception("Worker error: %s", e)
+
+    def _build_text_proc_kwargs(self) -> Dict[str, Any]:
+        """Text processing pipeline settings from the current config."""
+        return dict(
+            enable_voice_commands=self._cfg.enable_voice_commands,
+            enable_smart_punctuation=self._cfg.enable_smart_punctuation,
+            auto_capitalize=self._cfg.auto_capitalize,
+            auto_periods=self._cfg.auto_periods,
+            auto_commas=self._cfg.auto_commas,
+            remove_fillers=self._cfg.remove_fillers
         )
 
-        # Configure punctuator
-        pipeline.configure(
-            auto_capitalize=self.config.get("auto_capitalize", True),
-            auto_periods=self.config.get("auto_periods", True),
-            auto_commas=self.config.get("auto_commas", True),
-            remove_fillers=self.config.get("remove_fillers", False)
+    def _build_preview_kwargs(self) -> Dict[str, Any]:
+        """Preview window settings from the current config."""
+        return dict(
+            auto_accept_delay=self._cfg.preview_auto_accept_delay,
+            show_shortcuts=self._cfg.preview_show_shortcuts,
+            font_size=self._cfg.preview_font_size,
+            position=self._cfg.preview_position,
+            theme=self._cfg.preview_theme
         )
 
+    def _is_text_proc_active(self) -> bool:
+        """Whether any text processing stage is enabled."""
+        return bool(
+            self._cfg.enable_voice_commands or
+            self._cfg.enable_smart_punctuation
+        )
+
+    def _create_text_processor(self) -> "TextProcessingPipeline":
+        """Create and configure the text processing pipeline."""
+        from text_processor import TextProcessingPipeline
+
+        # Kept so update_config can skip reconfiguring when nothing changed
+        self._text_proc_kwargs = self._build_text_proc_kwargs()
+
+        pipeline = TextProcessingPipeline()
+        pipeline.configure(**self._text_proc_kwargs)
+
         return pipeline
 
-    def _create_preview_manager(self) -> PreviewManager:
+    def _create_preview_manager(self) -> "PreviewManager":
         """Create and configure the preview manager."""
-        preview_config = PreviewWindowConfig(
-            auto_accept_delay=self.config.get("preview_auto_accept_delay", 0.0),
-            show_shortcuts=self.config.get("preview_show_shortcuts", True),
-            font_size=self.config.get("preview_font_size", 12),
-            position=self.config.get("preview_position", "center"),
-            theme=self.config.get("preview_theme", "dark")
-        )
+        from preview_window import PreviewManager, PreviewWindowConfig
+
+        self._preview_kwargs = self._build_preview_kwargs()
+        preview_config = PreviewWindowConfig(**self._preview_kwargs)
 
         manager = PreviewManager(config=preview_config)
-        manager.enabled = self.config.get("enable_preview", True)
+        manager.enabled = self._cfg.enable_preview
 
         return manager
 
@@ -223,22 +412,25 @@ class STTApp:
 
     def _init_streaming(self) -> None:
         """Initialize streaming components after model is loaded."""
-        if not self.config.get("enable_streaming", True):
-            print("Streaming mode disabled in config")
+        if not self._cfg.enable_streaming:
+            log.info("Streaming mode disabled in config")
             return
 
         if not self.transcriber.is_loaded():
-            print("Warning: Cannot init streaming - model not loaded")
+            log.warning("Cannot init streaming - model not loaded")
             return
 
         try:
+            from streaming_transcriber import StreamingTranscriber
+            from streaming_coordinator import StreamingCoordinator
+
             # Create streaming transcriber sharing the loaded model
             self._streaming_transcriber = StreamingTranscriber(
                 model=self.transcriber._model,
-                chunk_duration=self.config.get("streaming_chunk_duration", 1.0),
-                buffer_duration=self.config.get("streaming_buffer_duration", 5.0),
-                agreement_threshold=self.config.get("streaming_agreement_threshold", 2),
-                language=self.config.get("language")
+                chunk_duration=self._cfg.streaming_chunk_duration,
+                buffer_duration=self._cfg.streaming_buffer_duration,
+                agreement_threshold=self._cfg.streaming_agreement_threshold,
+                language=self._cfg.language
             )
 
             # Create streaming coordinator
@@ -250,15 +442,13 @@ class STTApp:
                 on_tentative_update=self._on_streaming_tentative,
                 on_state_change=self._on_streaming_state_change,
                 on_error=self._on_streaming_error,
-                enable_corrections=self.config.get("streaming_enable_corrections", True)
+                enable_corrections=self._cfg.streaming_enable_corrections
             )
 
-            print("Streaming mode initialized successfully")
+            log.info("Streaming mode initialized successfully")
 
         except Exception as e:
-            print(f"Error initializing streaming: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error initializing streaming: %s", e)
             self._streaming_transcriber = None
             self._streaming_coordinator = None
 
@@ -269,35 +459,43 @@ class STTApp:
 
     def _on_streaming_tentative(self, tentative: str) -> None:
         """Callback for tentative text updates."""
-        # Could show tentative text in UI
-        if tentative:
-            self.gui.update_title(f"Earworm - ...{tentative[-30:]}")
+        if not tentative:
+            return
+
+        suffix = tentative[-30:] if len(tentative) > 30 else tentative
+        if suffix == self._last_title_suffix:
+            return
 
-    def _on_streaming_state_change(self, state: StreamingState) -> None:
+        self._last_title_suffix = suffix
+        self.gui.update_title("Earworm - ..." + suffix)
+
+    def _on_streaming_state_change(self, state: "StreamingState") -> None:
         """Callback for streaming state changes."""
+        from streaming_coordinator import StreamingState
+
         if state == StreamingState.STREAMING:
-            self.gui.set_state(StatusWindow.STATE_RECORDING)
+            self.gui.set_state(self.gui.STATE_RECORDING)
         elif state == StreamingState.STOPPING:
-            self.gui.set_state(StatusWindow.STATE_PROCESSING)
+            self.gui.set_state(self.gui.STATE_PROCESSING)
         elif state == StreamingState.IDLE:
-            self.gui.set_state(StatusWindow.STATE_IDLE)
+            self.gui.set_state(self.gui.STATE_IDLE)
 
     def _on_streaming_error(self, error: Exception) -> None:
         """Callback for streaming errors."""
-        print(f"Streaming error: {error}")
-        if self.config.get("show_notifications"):
+        log.error("Streaming error: %s", error)
+        if self._cfg.show_notifications:
             self.gui.notify("Streaming Error", str(error))
 
     def start_recording(self) -> None:
         """Start recording audio (called on key press)."""
         with self._lock:
-            if self._processing or self._is_recording:
+            if self._state != self._IDLE:
                 return
-            self._is_recording = True
+            self._state = self._RECORDING
 
         # Check if streaming mode is available and enabled
         use_streaming = (
-            self.config.get("enable_streaming", True) and
+            self._cfg.enable_streaming and
             self._streaming_coordinator is not None
         )
 
@@ -305,270 +503,297 @@ class STTApp:
             # Streaming mode: type words as they're transcribed
             self._streaming_mode = True
 
-            # Create recorder with streaming callback
-            self.recorder = AudioRecorder(
-                on_chunk=self._streaming_coordinator.feed_audio
-            )
+            # Reuse the recorder, routing chunks to the streaming pipeline
+            self.recorder.set_on_chunk(self._streaming_coordinator.feed_audio)
             self.recorder.start()
 
             # Start the streaming pipeline
+            self._last_title_suffix = ""
             self._streaming_coordinator.start_streaming()
 
-            self.gui.set_state(StatusWindow.STATE_RECORDING)
+            self.gui.set_state(self.gui.STATE_RECORDING)
             self.gui.update_title("Earworm - Streaming...")
-            print("Streaming started... (release F9 to stop)")
+            log.info("Streaming started... (release F9 to stop)")
         else:
             # Batch mode: record all then transcribe
             self._streaming_mode = False
-            self.recorder = AudioRecorder()
+            self.recorder.set_on_chunk(None)
             self.recorder.start()
-            self.gui.set_state(StatusWindow.STATE_RECORDING)
+            self.gui.set_state(self.gui.STATE_RECORDING)
             self.gui.update_title("Earworm - Recording...")
-            print("Recording started... (release F9 to stop)")
+            log.info("Recording started... (release F9 to stop)")
 
     def stop_recording(self) -> None:
         """Stop recording and process (called on key release)."""
         with self._lock:
-            if not self._is_recording:
+            if self._state != self._RECORDING:
                 return
-            self._is_recording = False
-            self._processing = True
+            self._state = self._PROCESSING
 
         if self._streaming_mode:
             # Streaming mode: finalize and clean up
-            self.gui.set_state(StatusWindow.STATE_PROCESSING)
+            self.gui.set_state(self.gui.STATE_PROCESSING)
             self.gui.update_title("Earworm - Finalizing...")
-            print("Streaming stopped, finalizing...")
-            threading.Thread(target=self._finalize_streaming, daemon=True).start()
+            log.info("Streaming stopped, finalizing...")
+            self._work_queue.put(self._finalize_streaming)
         else:
             # Batch mode: process the recorded audio
-            self.gui.set_state(StatusWindow.STATE_PROCESSING)
+            self.gui.set_state(self.gui.STATE_PROCESSING)
             self.gui.update_title("Earworm - Processing...")
-            print("Recording stopped, processing...")
-            threading.Thread(target=self._process_audio, daemon=True).start()
+            log.info("Recording stopped, processing...")
+            self._work_queue.put(self._process_audio)
 
     def _finalize_streaming(self) -> None:
         """Finalize streaming transcription."""
-        audio_path = None
         try:
             # Stop the streaming coordinator (types any remaining words)
             final_text = self._streaming_coordinator.stop_streaming()
 
-            # Stop the audio recorder
-            audio_path = self.recorder.stop()
-
-            # Clean up temp audio file
-            if audio_path:
-                cleanup_temp_file(audio_path)
+            # Stop the audio recorder (the audio itself is not needed)
+            self.recorder.discard()
 
             # Get stats
             stats = self._streaming_coordinator.stats
-            print(f"Streaming complete: {stats.words_typed} words typed, "
-                  f"{stats.words_corrected} corrections, "
-                  f"{stats.get_words_per_minute():.1f} WPM")
+            log.info("Streaming complete: %d words typed, %d corrections, %.1f WPM",
+                     stats.words_typed, stats.words_corrected,
+                     stats.get_words_per_minute())
 
-            if self.config.get("show_notifications") and final_text:
-                preview = final_text[:50] + "..." if len(final_text) > 50 else final_text
+            if self._cfg.show_notifications and final_text:
+                preview = _shorten(final_text)
                 self.gui.notify("Transcribed", preview)
 
         except Exception as e:
-            print(f"Error finalizing streaming: {e}")
-            import traceback
-            traceback.print_exc()
-            if self.config.get("show_notifications"):
+            log.exception("Error finalizing streaming: %s", e)
+            if self._cfg.show_notifications:
                 self.gui.notify("Error", str(e))
 
-            # Clean up on error
-            if audio_path:
-                cleanup_temp_file(audio_path)
-
         finally:
             self._streaming_mode = False
             self._finish_processing()
 
     def toggle_recording(self) -> None:
         """Toggle recording on/off (for tray menu)."""
-        with self._lock:
-            if self._processing:
-                return
-            is_recording = self._is_recording
+        # Lock-free snapshot; start/stop_recording re-check under the lock
+        state = self._state
+        if state == self._PROCESSING:
+            return
 
-        if is_recording:
+        if state == self._RECORDING:
             self.stop_recording()
         else:
             self.start_recording()
 
     def _process_audio(self) -> None:
         """Process recorded audio: transcribe, process text, preview, and type."""
-        audio_path = None
         try:
-            # Get the recorded audio file
-            audio_path = self.recorder.stop()
+            # Get the recorded audio, kept in memory for Whisper
+            audio = self.recorder.stop_array()
 
-            if not audio_path:
-                print("No audio recorded!")
+            if audio is None:
+                log.info("No audio recorded!")
                 self._finish_processing()
                 return
 
             # Transcribe
-            print(f"Transcribing audio file: {audio_path}")
+            log.debug("Transcribing %.1f s of audio", len(audio) / self.recorder.sample_rate)
             raw_text = self.transcriber.transcribe(
-                audio_path,
-                language=self.config.get("language")
+                audio,
+                language=self._cfg.language
             )
 
             if not raw_text:
-                print("No speech detected in audio")
-                if self.config.get("show_notifications"):
+                log.info("No speech detected in audio")
+                if self._cfg.show_notifications:
                     self.gui.notify("No Speech", "No speech was detected")
-                self._finish_processing(audio_path)
+                self._finish_processing()
                 return
 
-            print(f"Raw transcription: {raw_text}")
+            log.debug("Raw transcription: %s", raw_text)
 
             # Process through text pipeline (voice commands + smart punctuation)
-            processed_text, commands = self.text_processor.process(raw_text)
-            print(f"Processed text: {processed_text}")
+            # (skipped entirely when every stage is disabled)
+            if self._text_proc_active:
+                processed_text, commands = self.text_processor.process(raw_text)
+            else:
+                processed_text, commands = raw_text, []
+            log.debug("Processed text: %s", processed_text)
 
             if commands:
-                print(f"Voice commands executed: {[c.action.name for c in commands]}")
-
-            # Clean up audio file before preview (we don't need it anymore)
-            if audio_path:
-                cleanup_temp_file(audio_path)
-                audio_path = None
+                log.debug("Voice commands executed: %s", [c.action.name for c in commands])
 
             # Show preview or type directly
-            if self.config.get("enable_preview", True):
+            if self._cfg.enable_preview:
                 self._show_preview(processed_text)
             else:
                 self._type_text(processed_text)
 
         except Exception as e:
-            print(f"Error processing audio: {e}")
-            import traceback
-            traceback.print_exc()
-            if self.config.get("show_notifications"):
+            log.exception("Error processing audio: %s", e)
+            if self._cfg.show_notifications:
                 self.gui.notify("Error", str(e))
-            self._finish_processing(audio_path)
+            self._finish_processing()
 
     def _show_preview(self, text: str) -> None:
         """Show the preview window for text review."""
+        from keyboard_typer import get_foreground_window
+
+        if self.preview_manager is None:
+            self.preview_manager = self._create_preview_manager()
+
         # Set the parent window for positioning
         if self.gui._root:
             self.preview_manager.set_parent(self.gui._root)
 
-        def on_preview_complete(result: PreviewResult):
-            """Handle preview window result."""
-            if result.action == PreviewAction.ACCEPT:
-                self._type_text(result.text)
-            elif result.action == PreviewAction.COPY_ONLY:
-                print(f"Text copied to clipboard: {result.text[:50]}...")
-                if self.config.get("show_notifications"):
-                    self.gui.notify("Copied", "Text copied to clipboard")
-                self._finish_processing()
-            elif result.action == PreviewAction.RERECORD:
-                print("Re-recording requested")
-                self._finish_processing()
-                # Start recording again immediately
-                self.gui._root.after(100, self.start_recording)
-            elif result.action == PreviewAction.CANCEL:
-                print("Preview cancelled")
-                self._finish_processing()
-
-        def on_rerecord():
-            """Callback for re-record button."""
-            # This is called from the preview window
-            pass  # The actual re-recording is triggered in on_preview_complete
+        # Remember where the text should go once the preview closes
+        self._target_window = get_foreground_window()
 
+        # Re-recording is handled through the RERECORD result, so no
+        # separate on_rerecord callback is needed
         self.preview_manager.show_preview(
             text=text,
-            on_complete=on_preview_complete,
-            on_rerecord=on_rerecord
+            on_complete=self._on_preview_complete
         )
 
-    def _type_text(self, text: str) -> None:
-        """Type the processed text into the active window."""
+    def _on_preview_complete(self, result: "PreviewResult") -> None:
+        """Handle preview window result."""
+        handler = _PREVIEW_ACTIONS.get(result.action.name)
+        if handler is not None:
+            getattr(self, handler)(result)
+
+    def _preview_accept(self, result: "PreviewResult") -> None:
+        self._type_text(result.text, wait_for_focus=True)
+
+    def _preview_copy(self, result: "PreviewResult") -> None:
+        log.info("Text copied to clipboard: %.50s...", result.text)
+        if self._cfg.show_notifications:
+            self.gui.notify("Copied", "Text copied to clipboard")
+        self._finish_processing()
+
+    def _preview_rerecord(self, result: "PreviewResult") -> None:
+        log.info("Re-recording requested")
+        self._finish_processing()
+        # Start recording again immediately
+        self.gui._root.after(100, self.start_recording)
+
+    def _preview_cancel(self, result: "PreviewResult") -> None:
+        log.info("Preview cancelled")
+        self._finish_processing()
+
+    def _type_text(self, text: str, wait_for_focus: bool = False) -> None:
+        """
+        Type the processed text into the active window.
+
+        Args:
+            text: Text to type.
+            wait_for_focus: If True, first wait (briefly) for focus to return
+                            to the window that was active before the preview.
+        """
         if not text:
             self._finish_processing()
             return
 
-        # Small delay to ensure focus is back on the original window
-        time.sleep(0.1)
-
-        # Type the text
-        self.typer.type_text(
+        # Typing, and any wait for focus, runs on the typer's own thread so
+        # neither the worker nor the Tk thread (preview callbacks) blocks on it
+        self.typer.type_text_async(
             text,
-            use_clipboard=self.config.get("use_clipboard", True)
+            use_clipboard=self._cfg.use_clipboard,
+            wait_for_focus=wait_for_focus,
+            focus_window=self._target_window,
+            on_done=lambda error: self._on_text_typed(text, error)
         )
 
-        print(f"Typed: {text}")
+    def _on_text_typed(self, text: str, error: Optional[Exception]) -> None:
+        """Report the outcome of typing and reset state (typer thread)."""
+        if error is not None:
+            log.error("Error typing text: %s", error)
+            if self._cfg.show_notifications:
+                self.gui.notify("Error", str(error))
+        else:
+            log.info("Typed: %s", text)
 
-        if self.config.get("show_notifications"):
-            # Truncate long text for notification
-            preview = text[:50] + "..." if len(text) > 50 else text
-            self.gui.notify("Transcribed", preview)
+            if self._cfg.show_notifications:
+                # Truncate long text for notification
+                preview = _shorten(text)
+                self.gui.notify("Transcribed", preview)
 
         self._finish_processing()
 
-    def _finish_processing(self, audio_path: Optional[str] = None) -> None:
+    def _finish_processing(self) -> None:
         """Finish processing and reset state."""
-        # Clean up temp file if still exists
-        if audio_path:
-            cleanup_temp_file(audio_path)
-
         # Reset state
-        with self._lock:
-            self._processing = False
+        self._state = self._IDLE
 
-        self.gui.set_state(StatusWindow.STATE_IDLE)
+        self.gui.set_state(self.gui.STATE_IDLE)
         self.gui.update_title("Earworm - Ready")
 
     def cancel_recording(self) -> None:
         """Cancel the current recording without processing."""
         with self._lock:
-            if not self._is_recording:
+            if self._state != self._RECORDING:
                 return
+            # Drop the audio before publishing IDLE, so a start_recording()
+            # racing in can't begin a new capture that this would tear down
+            self.recorder.discard()
+            self._state = self._IDLE
 
-            self._is_recording = False
-            self.recorder.stop()  # Discard the audio
-            self.gui.set_state(StatusWindow.STATE_IDLE)
-            self.gui.update_title("Earworm - Ready")
+        self.gui.set_state(self.gui.STATE_IDLE)
+        self.gui.update_title("Earworm - Ready")
 
-            print("Recording cancelled")
+        log.info("Recording cancelled")
 
-            if self.config.get("show_notifications"):
-                self.gui.notify("Cancelled", "Recording was cancelled")
+        if self._cfg.show_notifications:
+            self.gui.notify("Cancelled", "Recording was cancelled")
 
     def preload_model(self) -> None:
         """Pre-load the Whisper model (avoid delay on first use)."""
-        print("Pre-loading Whisper model...")
+        log.info("Pre-loading Whisper model...")
         self.gui.update_title("Earworm - Loading model...")
 
         def load():
             try:
-                self.transcriber.load_model()
-                print("Model loaded successfully!")
+                # Warm up the text pipeline while the model loads
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    model_future = pool.submit(self.transcriber.load_model)
+                    pool.submit(self._warm_up_text_processor)
+                    model_future.result()
+                log.info("Model loaded successfully!")
 
                 # Initialize streaming mode after model is loaded
-                if self.config.get("enable_streaming", True):
-                    print("Initializing streaming mode...")
+                if self._cfg.enable_streaming:
+                    log.info("Initializing streaming mode...")
                     self._init_streaming()
 
+                # Run a throwaway pass so the first real recording doesn't
+                # pay for backend kernel initialization
+                self.transcriber.warm_up()
+
+                # The GUI is started in parallel; make sure it can show this
+                self.gui.wait_until_ready()
                 self.gui.update_title("Earworm - Ready")
 
                 mode = "streaming" if self._streaming_coordinator else "batch"
-                if self.config.get("show_notifications"):
+                if self._cfg.show_notifications:
                     self.gui.notify(
                         "Ready",
                         f"Model loaded ({mode} mode). Hold F9 to record."
                     )
             except Exception as e:
-                print(f"Error loading model: {e}")
+                log.error("Error loading model: %s", e)
+                self.gui.wait_until_ready()
                 self.gui.notify("Error", f"Failed to load model: {e}")
 
         threading.Thread(target=load, daemon=True).start()
 
+    def _warm_up_text_processor(self) -> None:
+        """Run the text pipeline once so its regexes are compiled up front."""
+        try:
+            self.text_processor.process("warm up period")
+        except Exception as e:
+            log.warning("Text processor warm-up failed: %s", e)
+        finally:
+            # Don't leave the warm-up text in the undo history
+            self.text_processor.reset()
+
     def update_config(self, updates: Dict[str, Any]) -> None:
         """
         Update configuration and reconfigure components.
@@ -577,29 +802,26 @@ class STTApp:
             updates: Dictionary of config key-value pairs to update
         """
         self.config.update(updates)
-
-        # Reconfigure text processor
-        self.text_processor.configure(
-            enable_voice_commands=self.config.get("enable_voice_commands", True),
-            enable_smart_punctuation=self.config.get("enable_smart_punctuation", True),
-            auto_capitalize=self.config.get("auto_capitalize", True),
-            auto_periods=self.config.get("auto_periods", True),
-            auto_commas=self.config.get("auto_commas", True),
-            remove_fillers=self.config.get("remove_fillers", False)
-        )
-
-        # Reconfigure preview manager
-        self.preview_manager.enabled = self.config.get("enable_preview", True)
-        self.preview_manager.configure(
-            auto_accept_delay=self.config.get("preview_auto_accept_delay", 0.0),
-            show_shortcuts=self.config.get("preview_show_shortcuts", True),
-            font_size=self.config.get("preview_font_size", 12),
-            position=self.config.get("preview_position", "center"),
-            theme=self.config.get("preview_theme", "dark")
-        )
+        self._cfg.refresh(self.config)
+
+        # Reconfigure text processor, only if its settings changed
+        text_proc_kwargs = self._build_text_proc_kwargs()
+        if text_proc_kwargs != self._text_proc_kwargs:
+            self.text_processor.configure(**text_proc_kwargs)
+            self._text_proc_kwargs = text_proc_kwargs
+            self._text_proc_active = self._is_text_proc_active()
+
+        # Reconfigure preview manager (if it has been created yet)
+        if self.preview_manager is not None:
+            self.preview_manager.enabled = self._cfg.enable_preview
+            preview_kwargs = self._build_preview_kwargs()
+            if preview_kwargs != self._preview_kwargs:
+                self.preview_manager.configure(**preview_kwargs)
+                self._preview_kwargs = preview_kwargs
 
         # Update typer
-        self.typer.typing_delay = self.config.get("typing_delay", 0.0)
+        self.typer.typing_delay = self._cfg.typing_delay
+        self.typer.preserve_clipboard = self._cfg.preserve_clipboard
 
     def start(self) -> None:
         """Start the application."""
@@ -607,57 +829,93 @@ class STTApp:
             return
 
         self._running = True
-        print("Starting Earworm...")
+        self._stop_event.clear()
+        log.info("Starting Earworm...")
+
+        # Pre-load the model in background first, so it loads while the
+        # hotkey listener and GUI start up
+        self.preload_model()
 
         # Start components
-        self.gui.start()
         self.hotkey_manager.start()
+        self.gui.start()
 
-        # Pre-load the model in background
-        self.preload_model()
-
-        print("Earworm is running!")
-        print("Hold F9 to record, release to transcribe")
-        print("\nFeatures enabled:")
-        print(f"  - Streaming mode: {self.config.get('enable_streaming', True)}")
-        print(f"  - Voice commands: {self.config.get('enable_voice_commands', True)}")
-        print(f"  - Smart punctuation: {self.config.get('enable_smart_punctuation', True)}")
-        print(f"  - Preview window: {self.config.get('enable_preview', True)} (batch mode only)")
+        log.info("Earworm is running!")
+        log.info("Hold F9 to record, release to transcribe")
+        log.info("Features enabled:")
+        log.info("  - Streaming mode: %s", self._cfg.enable_streaming)
+        log.info("  - Voice commands: %s", self._cfg.enable_voice_commands)
+        log.info("  - Smart punctuation: %s", self._cfg.enable_smart_punctuation)
+        log.info("  - Preview window: %s (batch mode only)", self._cfg.enable_preview)
 
     def stop(self) -> None:
         """Stop the application."""
         if not self._running:
             return
 
-        print("Stopping Earworm...")
+        log.info("Stopping Earworm...")
         self._running = False
 
         # Close any open preview window
-        self.preview_manager.close_current()
+        if self.preview_manager is not None:
+            self.preview_manager.close_current()
 
         # Stop components
         self.hotkey_manager.stop()
 
-        if self._is_recording:
-            self.recorder.stop()
+        if self._state == self._RECORDING:
+            self.recorder.discard()
+        self.recorder.close()
+        self.typer.close()
 
         self.gui.stop()
-        print("Earworm stopped.")
+
+        # Let the worker exit once it has finished any queued job
+        self._work_queue.put(None)
+        log.info("Earworm stopped.")
+
+        # Wake up run()
+        self._stop_event.set()
 
     def run(self) -> None:
         """Run the application (blocking)."""
         self.start()
 
         try:
-            # Keep running until stopped
-            while self._running:
-                time.sleep(0.1)
+            # Block until stop() is called. The timeout only keeps Ctrl+C
+            # working on Windows, where an untimed wait can't be interrupted.
+            while not self._stop_event.wait(timeout=1.0):
+                pass
         except KeyboardInterrupt:
             pass
         finally:
             self.stop()
 
 
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _disable(value: Any) -> bool:
+    return False
+
+
+# Command line option (argparse dest) -> (config key, value transform)
+ARG_MAP = (
+    ("model", "model_size", _identity),
+    ("language", "language", _identity),
+    ("no_notifications", "show_notifications", _disable),
+    ("no_voice_commands", "enable_voice_commands", _disable),
+    ("no_punctuation", "enable_smart_punctuation", _disable),
+    ("no_preview", "enable_preview", _disable),
+    ("no_streaming", "enable_streaming", _disable),
+    ("streaming_chunk", "streaming_chunk_duration", _identity),
+    ("streaming_buffer", "streaming_buffer_duration", _identity),
+    ("auto_accept", "preview_auto_accept_delay", _identity),
+    ("theme", "preview_theme", _identity),
+)
+
+
 def main():
     """Entry point for the application."""
     import argparse
@@ -739,32 +997,23 @@ def main():
 
     args = parser.parse_args()
 
+    setup_logging()
+
     # Load config
     config = Config()
 
-    # Override with command line args
-    if args.model:
-        config.set("model_size", args.model)
-    if args.language:
-        config.set("language", args.language)
-    if args.no_notifications:
-        config.set("show_notifications", False)
-    if args.no_voice_commands:
-        config.set("enable_voice_commands", False)
-    if args.no_punctuation:
-        config.set("enable_smart_punctuation", False)
-    if args.no_preview:
-        config.set("enable_preview", False)
-    if args.no_streaming:
-        config.set("enable_streaming", False)
-    if args.streaming_chunk is not None:
-        config.set("streaming_chunk_duration", args.streaming_chunk)
-    if args.streaming_buffer is not None:
-        config.set("streaming_buffer_duration", args.streaming_buffer)
-    if args.auto_accept is not None:
-        config.set("preview_auto_accept_delay", args.auto_accept)
-    if args.theme:
-        config.set("preview_theme", args.theme)
+    # Override with command line args, written to disk in one go
+    updates = {}
+    for attr, key, transform in ARG_MAP:
+        value = getattr(args, attr)
+        # None = option not given; False = store_true flag not given;
+        # "" = empty string option (e.g. --language ""), ignored as before.
+        # Not a truthiness test: an explicit 0 / 0.0 still counts as given.
+        if value is None or value is False or value == "":
+            continue
+        updates[key] = transform(value)
+    if updates:
+        config.update(updates)
 
     # Create and run app
     app = STTApp(config)
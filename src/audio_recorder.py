@@ -6,21 +6,41 @@ Records from the default microphone until stopped.
 import numpy as np
 import sounddevice as sd
 import threading
-import queue
 from typing import Optional, Callable
 import tempfile
 import wave
 import os
 
 
+def _float_to_pcm16(audio: np.ndarray) -> np.ndarray:
+    """
+    Convert float32 samples in [-1, 1] to 16-bit PCM.
+
+    Out-of-range samples are clipped rather than left to wrap around
+    (which turns them into loud clicks). Works in a single scratch buffer.
+
+    Args:
+        audio: Float audio samples.
+
+    Returns:
+        int16 array of the same shape.
+    """
+    tmp = np.clip(audio, -1.0, 1.0, out=np.empty_like(audio))
+    np.multiply(tmp, 32767.0, out=tmp)
+    np.rint(tmp, out=tmp)
+    return tmp.astype(np.int16)
+
+
 class AudioRecorder:
-    """Records audio from the microphone and saves to a temporary WAV file."""
+    """Records audio from the microphone, returned in memory or as a temporary WAV file."""
 
     def __init__(
         self,
         sample_rate: int = 16000,
         channels: int = 1,
-        on_chunk: Optional[Callable[[np.ndarray], None]] = None
+        on_chunk: Optional[Callable[[np.ndarray], None]] = None,
+        block_duration: float = 0.1,
+        keep_stream_open: bool = False
     ):
         """
         Args:
@@ -28,109 +48,153 @@ class AudioRecorder:
             channels: Number of audio channels. Mono (1) is fine for speech.
             on_chunk: Optional callback invoked for each audio chunk during recording.
                       Used for real-time streaming transcription.
+            block_duration: Audio delivered per stream callback, in seconds.
+                            Larger blocks mean fewer Python callbacks; 100 ms
+                            is well under what push-to-talk can notice.
+            keep_stream_open: If True, open the input stream on the first
+                              start() and keep it open (idle) between
+                              recordings, so later starts skip the device
+                              open. Call close() to release the device.
         """
         self.sample_rate = sample_rate
         self.channels = channels
+        self.blocksize = max(1, int(sample_rate * block_duration))
         self._on_chunk = on_chunk
+        self._keep_stream_open = keep_stream_open
         self._recording = False
-        self._audio_queue: queue.Queue = queue.Queue()
-        self._audio_data: list = []
+
+        # Recorded samples (interleaved if multi-channel) are copied straight
+        # into one preallocated buffer, sized for a minute of audio and
+        # doubled if a recording outgrows it, so stopping needs no concat
+        self._buffer = np.empty(sample_rate * channels * 60, dtype=np.float32)
+        self._write_pos = 0
         self._stream: Optional[sd.InputStream] = None
-        self._record_thread: Optional[threading.Thread] = None
+        self._stream_finished = False  # Set if the stream stopped by itself
         self._data_lock = threading.Lock()
 
     def _audio_callback(self, indata: np.ndarray, frames: int,
                         time_info: dict, status: sd.CallbackFlags) -> None:
         """Callback function for the audio stream."""
-        # Put a copy of the audio data into the queue
-        chunk = indata.copy()
-        self._audio_queue.put(chunk)
+        # A kept-open stream keeps delivering audio between recordings
+        if not self._recording:
+            return
 
-        # Real-time callback for streaming mode
-        if self._on_chunk:
+        # Copy the audio data into the buffer (indata is reused by PortAudio)
+        n = indata.size
+        with self._data_lock:
+            start = self._write_pos
+            end = start + n
+            if end > self._buffer.size:
+                grown = np.empty(max(end, self._buffer.size * 2), dtype=np.float32)
+                grown[:start] = self._buffer[:start]
+                self._buffer = grown
+            chunk = self._buffer[start:end]
+            np.copyto(chunk, indata.reshape(-1))
+            self._write_pos = end
+
+        # Real-time callback for streaming mode. Read the attribute once:
+        # set_on_chunk() may swap it from another thread at any time.
+        on_chunk = self._on_chunk
+        if on_chunk is not None:
             try:
-                self._on_chunk(chunk)
+                # A view of the block just written, in the stream's
+                # (frames, channels) shape; nothing is allocated per block
+                on_chunk(chunk.reshape(indata.shape))
             except Exception:
                 pass  # Silently ignore callback errors
 
-    def _record_loop(self) -> None:
-        """Background thread that collects audio data from the queue."""
-        while self._recording:
-            try:
-                data = self._audio_queue.get(timeout=0.1)
-                with self._data_lock:
-                    self._audio_data.append(data)
-            except queue.Empty:
-                continue
-
     def start(self) -> None:
         """Start recording audio from the microphone."""
         if self._recording:
             return
 
+        with self._data_lock:
+            self._write_pos = 0
         self._recording = True
-        self._audio_data = []
 
-        # Clear the queue
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-            except queue.Empty:
-                break
-
-        # Start the audio stream
-        self._stream = sd.InputStream(
-            samplerate=self.sample_rate,
-            channels=self.channels,
-            dtype=np.float32,
-            callback=self._audio_callback
-        )
-        self._stream.start()
+        # A kept-open stream that errored or lost its device since the last
+        # recording is dead; drop it so a fresh one is opened below
+        stream = self._stream
+        if stream is not None and (self._stream_finished or not stream.active):
+            self._close_stream()
+
+        # Start the audio stream (unless it was kept open)
+        if self._stream is None:
+            self._stream_finished = False
+            self._stream = sd.InputStream(
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                dtype=np.float32,
+                blocksize=self.blocksize,
+                callback=self._audio_callback,
+                finished_callback=self._on_stream_finished
+            )
+            self._stream.start()
+
+    def _on_stream_finished(self) -> None:
+        """Called by PortAudio when the stream stops, e.g. on device loss."""
+        self._stream_finished = True
+
+    def stop_array(self) -> Optional[np.ndarray]:
+        """
+        Stop recording and return the audio in memory.
 
-        # Start the collection thread
-        self._record_thread = threading.Thread(target=self._record_loop, daemon=True)
-        self._record_thread.start()
+        The result is 1-D float32 at `sample_rate`, which faster-whisper can
+        take directly, so no WAV file needs to be written and decoded again.
 
-    def stop(self) -> Optional[str]:
+        Returns:
+            The recorded audio, or None if no audio was recorded.
         """
-        Stop recording and save audio to a temporary WAV file.
+        if not self._halt():
+            return None
+
+        with self._data_lock:
+            if self._write_pos == 0:
+                return None
+            # Copy out, since the buffer is reused by the next recording
+            audio = self._buffer[:self._write_pos].copy()
+            self._write_pos = 0
+
+        return audio
+
+    def discard(self) -> None:
+        """Stop recording and drop the audio, without copying it out."""
+        if not self._halt():
+            return
+
+        with self._data_lock:
+            self._write_pos = 0
+
+    def _halt(self) -> bool:
+        """
+        Stop capturing into the buffer.
 
         Returns:
-            Path to the temporary WAV file, or None if no audio was recorded.
+            True if a recording was in progress.
         """
         if not self._recording:
-            return None
+            return False
 
         self._recording = False
 
-        # Stop the stream
-        if self._stream:
-            self._stream.stop()
-            self._stream.close()
-            self._stream = None
+        # Stop the stream; once _recording is cleared, callbacks from a
+        # kept-open stream no longer append
+        if not self._keep_stream_open:
+            self._close_stream()
+        return True
 
-        # Wait for the collection thread to finish
-        if self._record_thread:
-            self._record_thread.join(timeout=1.0)
-            self._record_thread = None
-
-        # Drain remaining items from queue
-        while not self._audio_queue.empty():
-            try:
-                data = self._audio_queue.get_nowait()
-                self._audio_data.append(data)
-            except queue.Empty:
-                break
+    def stop(self) -> Optional[str]:
+        """
+        Stop recording and save audio to a temporary WAV file.
 
-        # Check if we have any audio
-        if not self._audio_data:
+        Returns:
+            Path to the temporary WAV file, or None if no audio was recorded.
+        """
+        audio = self.stop_array()
+        if audio is None:
             return None
 
-        # Concatenate all audio chunks
-        audio = np.concatenate(self._audio_data, axis=0)
-
-        # Convert float32 [-1, 1] to int16
-        audio_int16 = (audio * 32767).astype(np.int16)
+        audio_int16 = _float_to_pcm16(audio)
 
         # Save to temporary WAV file
         temp_file = tempfile.NamedTemporaryFile(
@@ -149,6 +213,23 @@ class AudioRecorder:
 
         return temp_path
 
+    def _close_stream(self) -> None:
+        """Stop and close the input stream, if open."""
+        stream, self._stream = self._stream, None
+        if stream is None:
+            return
+        try:
+            stream.stop()
+            stream.close()
+        except sd.PortAudioError:
+            # Already broken (e.g. device unplugged); nothing left to release
+            pass
+
+    def close(self) -> None:
+        """Stop any recording and release the audio device."""
+        self._recording = False
+        self._close_stream()
+
     def is_recording(self) -> bool:
         """Check if currently recording."""
         return self._recording
@@ -164,9 +245,10 @@ class AudioRecorder:
             Concatenated audio as numpy array, or None if no audio yet.
         """
         with self._data_lock:
-            if not self._audio_data:
+            if self._write_pos == 0:
                 return None
-            return np.concatenate(self._audio_data, axis=0)
+            audio = self._buffer[:self._write_pos].copy()
+        return audio.reshape(-1, self.channels)
 
     def set_on_chunk(self, callback: Optional[Callable[[np.ndarray], None]]) -> None:
         """
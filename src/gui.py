@@ -7,12 +7,20 @@ import tkinter as tk
 from tkinter import ttk
 import threading
 import math
-from typing import Callable, Optional, List
+import time
+import functools
+from typing import Callable, Optional, Dict, List
 from PIL import Image, ImageDraw, ImageTk
 
 
+@functools.lru_cache(maxsize=16)
 def create_ear_icon(size: int = 32, color: str = "#4CAF50") -> Image.Image:
-    """Create an ear-shaped icon programmatically."""
+    """
+    Create an ear-shaped icon programmatically.
+
+    The result is cached per (size, color) and shared between callers, so
+    copy it before drawing on it.
+    """
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
 
@@ -31,8 +39,8 @@ def create_ear_icon(size: int = 32, color: str = "#4CAF50") -> Image.Image:
         (24 * s, 42 * s),
     ]
 
-    for i in range(len(ear_points) - 1):
-        draw.line([ear_points[i], ear_points[i + 1]], fill=color, width=max(2, int(3 * s)))
+    # One polyline call instead of a draw call per segment
+    draw.line(ear_points, fill=color, width=max(2, int(3 * s)))
 
     wave_color = color
     draw.arc([int(8 * s), int(24 * s), int(18 * s), int(40 * s)],
@@ -43,15 +51,21 @@ def create_ear_icon(size: int = 32, color: str = "#4CAF50") -> Image.Image:
     return img
 
 
+@functools.lru_cache(maxsize=128)
 def hex_to_rgb(hex_color: str) -> tuple:
-    """Convert hex color to RGB tuple."""
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    """Convert hex color to RGB tuple (cached; only a few palette colors are used)."""
+    value = int(hex_color.lstrip('#'), 16)
+    return (value >> 16) & 0xff, (value >> 8) & 0xff, value & 0xff
+
+
+@functools.lru_cache(maxsize=1024)
+def _rgb_int_to_hex(r: int, g: int, b: int) -> str:
+    return '#{:06x}'.format((r & 0xff) << 16 | (g & 0xff) << 8 | (b & 0xff))
 
 
 def rgb_to_hex(rgb: tuple) -> str:
     """Convert RGB tuple to hex color."""
-    return '#{:02x}{:02x}{:02x}'.format(int(rgb[0]), int(rgb[1]), int(rgb[2]))
+    return _rgb_int_to_hex(int(rgb[0]), int(rgb[1]), int(rgb[2]))
 
 
 def lerp_color(color1: str, color2: str, t: float) -> str:
@@ -64,6 +78,15 @@ def lerp_color(color1: str, color2: str, t: float) -> str:
     return rgb_to_hex((r, g, b))
 
 
+# Number of precomputed steps in each animation color gradient
+GRADIENT_STEPS = 64
+
+
+def make_gradient(color1: str, color2: str, steps: int = GRADIENT_STEPS) -> tuple:
+    """Precompute `steps` hex colors evenly spaced from color1 to color2."""
+    return tuple(lerp_color(color1, color2, i / (steps - 1)) for i in range(steps))
+
+
 class StatusWindow:
     """A small always-on-top window showing Earworm status with animations."""
 
@@ -71,6 +94,26 @@ class StatusWindow:
     STATE_RECORDING = "recording"
     STATE_PROCESSING = "processing"
 
+    # Milliseconds between animation frames per state. The idle pulse is
+    # slow enough that 15 FPS looks the same as 30 and costs half as much.
+    _FRAME_DELAYS = {
+        STATE_IDLE: 66,
+        STATE_RECORDING: 33,
+        STATE_PROCESSING: 33,
+    }
+
+    # State -> method that draws it
+    _STATE_SETUP = {
+        STATE_IDLE: "_setup_idle_state",
+        STATE_RECORDING: "_setup_recording_state",
+        STATE_PROCESSING: "_setup_processing_state",
+    }
+
+    # Animation speeds below are per frame at this nominal rate; the actual
+    # frame count is derived from elapsed time, so late ticks don't slow
+    # the animations down
+    ANIMATION_FPS = 30
+
     # Color scheme
     COLORS = {
         "bg": "#0d0d0d",
@@ -94,16 +137,35 @@ class StatusWindow:
         self._ready = threading.Event()
         self._icon_photo = None
         self._animation_id = None
-        self._animation_frame = 0
+        self._animation_frame = 0.0
+        self._animation_start = time.perf_counter()
         self._soundwave_bars: List[int] = []
+        # (x1, x2, phase offset) per bar, fixed when the bars are created
+        self._soundwave_layout: List[tuple] = []
+        # Last (size in whole pixels, gradient index) drawn per animated
+        # item, so frames that wouldn't change anything on screen skip Tk
+        self._last_drawn: Dict[int, tuple] = {}
         self._loader_arc = None
         self._glow_circle = None
         self._text_id = None
         self._subtext_id = None
-        self._pulse_phase = 0
         self._drag_x = 0
         self._drag_y = 0
 
+        # Animation colors, looked up per frame instead of interpolated
+        self._idle_gradient = make_gradient(self.COLORS["idle"], self.COLORS["idle_glow"])
+        self._recording_gradient = make_gradient(
+            self.COLORS["recording"], self.COLORS["recording_glow"])
+        self._processing_gradient = make_gradient(
+            self.COLORS["processing"], self.COLORS["processing_glow"])
+
+        # Display updates requested from other threads. They are collected
+        # here and applied together in one Tk callback, so a burst of
+        # updates costs one event-loop pass instead of one each.
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._apply_scheduled = False
+
     def _create_window(self) -> None:
         """Create the tkinter window with canvas-based UI."""
         self._root = tk.Tk()
@@ -193,6 +255,8 @@ class StatusWindow:
         """Clear all animated elements."""
         self._canvas.delete("animated")
         self._soundwave_bars = []
+        self._soundwave_layout = []
+        self._last_drawn.clear()
         self._loader_arc = None
         self._glow_circle = None
 
@@ -247,6 +311,7 @@ class StatusWindow:
                 tags="animated"
             )
             self._soundwave_bars.append(bar)
+            self._soundwave_layout.append((x, x + bar_width, i * 0.8))
 
         # Status text
         self._text_id = self._canvas.create_text(
@@ -315,7 +380,7 @@ class StatusWindow:
         if self._canvas is None or self._root is None:
             return
 
-        self._animation_frame += 1
+        self._animation_frame = (time.perf_counter() - self._animation_start) * self.ANIMATION_FPS
 
         if self._state == self.STATE_IDLE:
             self._animate_idle()
@@ -324,30 +389,36 @@ class StatusWindow:
         elif self._state == self.STATE_PROCESSING:
             self._animate_processing()
 
-        self._animation_id = self._root.after(33, self._animate)  # ~30 FPS
+        delay = self._FRAME_DELAYS.get(self._state, 33)
+        self._animation_id = self._root.after(delay, self._animate)
 
     def _animate_idle(self) -> None:
         """Animate the idle state - gentle pulse."""
         if self._glow_circle is None:
             return
 
-        self._pulse_phase += 0.08
-        pulse = (math.sin(self._pulse_phase) + 1) / 2  # 0 to 1
+        pulse = (math.sin(self._animation_frame * 0.08) + 1) / 2  # 0 to 1
 
         cx, cy = 36, 40
         base_radius = 10
         pulse_amount = 4
-        radius = base_radius + pulse * pulse_amount
+        radius = round(base_radius + pulse * pulse_amount)
+        color_index = int(pulse * 0.5 * (GRADIENT_STEPS - 1))
 
-        self._canvas.coords(
-            self._glow_circle,
-            cx - radius, cy - radius,
-            cx + radius, cy + radius
-        )
+        last_radius, last_index = self._last_drawn.get(self._glow_circle, (None, None))
+
+        if radius != last_radius:
+            self._canvas.coords(
+                self._glow_circle,
+                cx - radius, cy - radius,
+                cx + radius, cy + radius
+            )
 
         # Subtle color pulse
-        color = lerp_color(self.COLORS["idle"], self.COLORS["idle_glow"], pulse * 0.5)
-        self._canvas.itemconfig(self._glow_circle, fill=color)
+        if color_index != last_index:
+            self._canvas.itemconfig(self._glow_circle, fill=self._idle_gradient[color_index])
+
+        self._last_drawn[self._glow_circle] = (radius, color_index)
 
     def _animate_recording(self) -> None:
         """Animate the recording state - soundwave bars."""
@@ -355,26 +426,36 @@ class StatusWindow:
             return
 
         center_y = 40
+        base_phase = self._animation_frame * 0.15
+
+        # Bind what the per-bar loop uses to locals
+        sin = math.sin
+        coords = self._canvas.coords
+        itemconfig = self._canvas.itemconfig
+        gradient = self._recording_gradient
+        last_drawn = self._last_drawn
+        max_index = GRADIENT_STEPS - 1
 
-        for i, bar in enumerate(self._soundwave_bars):
+        for bar, (x1, x2, offset) in zip(self._soundwave_bars, self._soundwave_layout):
             # Each bar has a different phase for wave effect
-            phase = self._animation_frame * 0.15 + i * 0.8
-            height = 6 + abs(math.sin(phase)) * 16
+            intensity = abs(sin(base_phase + offset))
+            height = round(6 + intensity * 16)
+            color_index = int(intensity * max_index)
 
-            coords = self._canvas.coords(bar)
-            x1 = coords[0]
-            x2 = coords[2]
+            last_height, last_index = last_drawn.get(bar, (None, None))
 
-            self._canvas.coords(
-                bar,
-                x1, center_y - height,
-                x2, center_y + height
-            )
+            if height != last_height:
+                coords(
+                    bar,
+                    x1, center_y - height,
+                    x2, center_y + height
+                )
 
             # Color pulse
-            intensity = abs(math.sin(phase))
-            color = lerp_color(self.COLORS["recording"], self.COLORS["recording_glow"], intensity)
-            self._canvas.itemconfig(bar, fill=color)
+            if color_index != last_index:
+                itemconfig(bar, fill=gradient[color_index])
+
+            last_drawn[bar] = (height, color_index)
 
     def _animate_processing(self) -> None:
         """Animate the processing state - spinning loader."""
@@ -383,16 +464,21 @@ class StatusWindow:
 
         # Rotate the arc
         angle = (self._animation_frame * 8) % 360
-        self._canvas.itemconfig(self._loader_arc, start=angle)
 
         # Pulse the extent for a more dynamic feel
         extent_pulse = 70 + math.sin(self._animation_frame * 0.1) * 30
-        self._canvas.itemconfig(self._loader_arc, extent=extent_pulse)
 
         # Color shimmer
         shimmer = (math.sin(self._animation_frame * 0.15) + 1) / 2
-        color = lerp_color(self.COLORS["processing"], self.COLORS["processing_glow"], shimmer)
-        self._canvas.itemconfig(self._loader_arc, outline=color)
+        color = self._processing_gradient[int(shimmer * (GRADIENT_STEPS - 1))]
+
+        # All three in one Tk call
+        self._canvas.itemconfig(
+            self._loader_arc,
+            start=angle,
+            extent=extent_pulse,
+            outline=color
+        )
 
     def _on_close(self) -> None:
         """Handle window close."""
@@ -408,6 +494,44 @@ class StatusWindow:
         """Register a callback."""
         self._callbacks[action] = callback
 
+    def _schedule_apply(self, urgent: bool = True) -> None:
+        """
+        Schedule _apply_pending unless already scheduled (hold _pending_lock).
+
+        Args:
+            urgent: If False, run it from Tk's idle queue, after pending
+                    events and redraws, instead of as a new event.
+        """
+        if not self._apply_scheduled:
+            self._apply_scheduled = True
+            if urgent:
+                self._root.after(0, self._apply_pending)
+            else:
+                self._root.after_idle(self._apply_pending)
+
+    def _apply_pending(self) -> None:
+        """Apply the latest pending display updates (runs on the Tk thread)."""
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = {}
+            self._apply_scheduled = False
+
+        if self._canvas is None:
+            return
+
+        setup = self._STATE_SETUP.get(pending.get("state"))
+        if setup is not None:
+            getattr(self, setup)()
+            # Start the new state's animation (and frame rate) right away
+            # rather than on the old state's next tick
+            if self._animation_id is not None:
+                self._root.after_cancel(self._animation_id)
+            self._animate()
+
+        notification = pending.get("notify")
+        if notification is not None:
+            self._show_notification(*notification)
+
     def set_state(self, state: str) -> None:
         """Update the display state."""
         self._state = state
@@ -415,18 +539,11 @@ class StatusWindow:
         if self._root is None:
             return
 
-        def update():
-            if self._canvas is None:
-                return
-
-            if state == self.STATE_IDLE:
-                self._setup_idle_state()
-            elif state == self.STATE_RECORDING:
-                self._setup_recording_state()
-            elif state == self.STATE_PROCESSING:
-                self._setup_processing_state()
-
-        self._root.after(0, update)
+        with self._pending_lock:
+            self._pending["state"] = state
+            # A newer state replaces a notification that hasn't been shown
+            self._pending.pop("notify", None)
+            self._schedule_apply()
 
     def update_title(self, title: str) -> None:
         """Update window title (no-op for borderless window)."""
@@ -437,46 +554,50 @@ class StatusWindow:
         if self._root is None or self._canvas is None:
             return
 
-        def show():
-            self._clear_animations()
-
-            # Success checkmark animation
-            cx, cy = 36, 40
-
-            # Draw checkmark
-            self._canvas.create_line(
-                cx - 8, cy,
-                cx - 2, cy + 6,
-                cx + 10, cy - 8,
-                fill="#00d26a",
-                width=3,
-                capstyle=tk.ROUND,
-                joinstyle=tk.ROUND,
-                tags="animated"
-            )
+        with self._pending_lock:
+            self._pending["notify"] = (title, message)
+            # Cosmetic; can wait for the next idle moment
+            self._schedule_apply(urgent=False)
 
-            self._text_id = self._canvas.create_text(
-                125, 32,
-                text=title,
-                font=("Segoe UI", 14, "bold"),
-                fill="#2196F3",
-                tags="animated"
-            )
+    def _show_notification(self, title: str, message: str) -> None:
+        """Draw a notification in place of the state display."""
+        self._clear_animations()
 
-            self._subtext_id = self._canvas.create_text(
-                125, 52,
-                text=message,
-                font=("Segoe UI", 9),
-                fill=self.COLORS["text_dim"],
-                tags="animated"
-            )
+        # Success checkmark animation
+        cx, cy = 36, 40
 
-            def restore():
-                self.set_state(self._state)
+        # Draw checkmark
+        self._canvas.create_line(
+            cx - 8, cy,
+            cx - 2, cy + 6,
+            cx + 10, cy - 8,
+            fill="#00d26a",
+            width=3,
+            capstyle=tk.ROUND,
+            joinstyle=tk.ROUND,
+            tags="animated"
+        )
 
-            self._root.after(2000, restore)
+        self._text_id = self._canvas.create_text(
+            125, 32,
+            text=title,
+            font=("Segoe UI", 14, "bold"),
+            fill="#2196F3",
+            tags="animated"
+        )
+
+        self._subtext_id = self._canvas.create_text(
+            125, 52,
+            text=message,
+            font=("Segoe UI", 9),
+            fill=self.COLORS["text_dim"],
+            tags="animated"
+        )
 
-        self._root.after(0, show)
+        def restore():
+            self.set_state(self._state)
+
+        self._root.after(2000, restore)
 
     def start(self) -> None:
         """Start the GUI in a background thread."""
@@ -485,7 +606,19 @@ class StatusWindow:
 
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
-        self._ready.wait(timeout=5)
+        self.wait_until_ready()
+
+    def wait_until_ready(self, timeout: float = 5.0) -> bool:
+        """
+        Block until the window has been created.
+
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            True if the window is ready.
+        """
+        return self._ready.wait(timeout=timeout)
 
     def stop(self) -> None:
         """Stop the GUI."""
@@ -496,8 +629,6 @@ class StatusWindow:
 
 
 if __name__ == "__main__":
-    import time
-
     print("Testing Earworm window...")
 
     window = StatusWindow()
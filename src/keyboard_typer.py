@@ -4,21 +4,163 @@ Types text into the currently active text field.
 """
 
 from pynput.keyboard import Controller, Key
+from typing import Callable, List, Optional, Tuple
+import functools
+import logging
+import queue
+import sys
+import threading
 import time
 
+# On Windows the ctypes clipboard below is used directly; pyperclip would
+# only wrap the same Win32 calls in another layer
+if sys.platform == "win32":
+    pyperclip = None
+else:
+    try:
+        import pyperclip  # Optional: cross-platform clipboard access
+    except ImportError:
+        pyperclip = None
+
+log = logging.getLogger(__name__)
+
+# SendInput constants
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+VK_BACK = 0x08
+VK_TAB = 0x09
+VK_RETURN = 0x0D
+
+# Control characters sent as virtual keys rather than Unicode, as pynput does
+_CONTROL_VKS = {"\n": VK_RETURN, "\r": VK_RETURN, "\t": VK_TAB}
+
+# Win32 clipboard and input APIs, resolved and typed once at import
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _user32 = ctypes.windll.user32
+    _kernel32 = ctypes.windll.kernel32
+
+    # Declare every prototype up front: without them ctypes passes and
+    # returns plain c_int, which truncates 64-bit handles and pointers
+    _user32.OpenClipboard.argtypes = [wintypes.HWND]
+    _user32.OpenClipboard.restype = wintypes.BOOL
+    _user32.EmptyClipboard.argtypes = []
+    _user32.EmptyClipboard.restype = wintypes.BOOL
+    _user32.CloseClipboard.argtypes = []
+    _user32.CloseClipboard.restype = wintypes.BOOL
+    _user32.GetClipboardData.argtypes = [wintypes.UINT]
+    _user32.GetClipboardData.restype = wintypes.HANDLE
+    _user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+    _user32.SetClipboardData.restype = wintypes.HANDLE
+    _user32.GetClipboardSequenceNumber.argtypes = []
+    _user32.GetClipboardSequenceNumber.restype = wintypes.DWORD
+    _user32.GetForegroundWindow.argtypes = []
+    _user32.GetForegroundWindow.restype = wintypes.HWND
+
+    _kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    _kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    _kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+    _kernel32.GlobalFree.restype = wintypes.HGLOBAL
+    _kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    _kernel32.GlobalLock.restype = ctypes.c_void_p
+    _kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    _kernel32.GlobalUnlock.restype = wintypes.BOOL
+    _kernel32.GlobalSize.argtypes = [wintypes.HGLOBAL]
+    _kernel32.GlobalSize.restype = ctypes.c_size_t
+
+    class _KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ("wVk", wintypes.WORD),
+            ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class _MOUSEINPUT(ctypes.Structure):
+        # Only here so the union, and so INPUT, has the size SendInput expects
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT)]
+
+    class _INPUT(ctypes.Structure):
+        _anonymous_ = ("u",)
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+    _user32.SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int]
+    _user32.SendInput.restype = wintypes.UINT
+else:
+    _user32 = _kernel32 = None
+
+# Upper bound on waiting for our clipboard write to become visible
+CLIPBOARD_READY_TIMEOUT = 0.05
+
+# Time the target app gets to read the clipboard before it is restored
+CLIPBOARD_RESTORE_DELAY = 0.1
+
+# Attempts at opening a clipboard held by another process, backing off from
+# 1 ms and doubling (about 0.5 s in total)
+CLIPBOARD_OPEN_ATTEMPTS = 10
+
+# Previous clipboard contents longer than this (in characters) aren't restored
+MAX_CLIPBOARD_RESTORE_CHARS = 1 << 20
+
 
 class KeyboardTyper:
     """Types text into the active text field using keyboard simulation."""
 
-    def __init__(self, typing_delay: float = 0.0):
+    def __init__(
+        self,
+        typing_delay: float = 0.0,
+        preserve_clipboard: bool = True,
+        max_restore_chars: int = MAX_CLIPBOARD_RESTORE_CHARS
+    ):
         """
         Args:
             typing_delay: Delay between keystrokes in seconds.
                           0.0 = instant (recommended for most apps).
                           Small delay (0.01-0.05) helps with some apps.
+            preserve_clipboard: If True, put back whatever was on the
+                                clipboard after pasting.
+            max_restore_chars: Previous clipboard text longer than this is
+                               left unrestored.
         """
         self.typing_delay = typing_delay
-        self._keyboard = Controller()
+        self.preserve_clipboard = preserve_clipboard
+        self.max_restore_chars = max_restore_chars
+
+        # What the last paste left on the clipboard, and the clipboard
+        # sequence number at that point (Windows only)
+        self._known_clipboard: Optional[str] = None
+        self._known_clipboard_seq: Optional[int] = None
+
+        # pynput controller, created on first use: setting it up isn't free
+        # (display connection on X11) and a session may never type anything
+        self._keyboard: Optional[Controller] = None
+
+        # Background typing thread for type_text_async(), started on first use
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    @property
+    def _kbd(self) -> Controller:
+        """The pynput keyboard controller, created on first access."""
+        keyboard = self._keyboard
+        if keyboard is None:
+            keyboard = self._keyboard = Controller()
+        return keyboard
 
     def type_text(self, text: str, use_clipboard: bool = True) -> None:
         """
@@ -37,56 +179,158 @@ class KeyboardTyper:
         else:
             self._type_characters(text)
 
+    def type_text_async(
+        self,
+        text: str,
+        use_clipboard: bool = True,
+        wait_for_focus: bool = False,
+        focus_window: Optional[int] = None,
+        on_done: Optional[Callable[[Optional[Exception]], None]] = None
+    ) -> None:
+        """
+        Queue text to be typed on the typer's background thread.
+
+        Returns immediately, so callers on the GUI thread don't block for
+        the paste. Queued texts are typed in order.
+
+        Args:
+            text: The text to type.
+            use_clipboard: Same as for type_text().
+            wait_for_focus: If True, first wait briefly for focus_window to
+                            be in the foreground again (see wait_for_foreground).
+            focus_window: Window handle from get_foreground_window(), or None.
+            on_done: Called on the typing thread once the text is typed, with
+                     None, or with the exception if typing failed.
+        """
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._type_loop,
+                    daemon=True,
+                    name="KeyboardTyper"
+                )
+                self._worker.start()
+        self._queue.put((text, use_clipboard, wait_for_focus, focus_window, on_done))
+
+    def _type_loop(self) -> None:
+        """Type queued texts until a None sentinel arrives."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+
+            text, use_clipboard, wait_for_focus, focus_window, on_done = job
+            error = None
+            try:
+                if wait_for_focus:
+                    wait_for_foreground(focus_window)
+                self.type_text(text, use_clipboard=use_clipboard)
+            except Exception as e:
+                error = e
+
+            if on_done is not None:
+                try:
+                    on_done(error)
+                except Exception as e:
+                    log.exception("Typing callback error: %s", e)
+
+    def close(self) -> None:
+        """Let the typing thread exit once it has typed anything still queued."""
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._queue.put(None)
+
     def _paste_text(self, text: str) -> None:
         """Paste text using clipboard (Ctrl+V on Windows)."""
+        seq_before = _clipboard_sequence()
+
+        # Save current clipboard content, unless there'd be nothing to restore
+        old_clipboard = None
+        if self.preserve_clipboard:
+            if seq_before is not None and seq_before == self._known_clipboard_seq:
+                # Nothing has written to the clipboard since our last paste,
+                # so its contents are already known; skip reading them back
+                old_clipboard = self._known_clipboard
+            else:
+                # None (or an error) means the clipboard couldn't be read as
+                # text; leave it alone rather than "restoring" an empty string
+                # over an image, file list or locked clipboard
+                try:
+                    old_clipboard = _clipboard_paste()
+                except (RuntimeError, OSError):
+                    old_clipboard = None
+            if old_clipboard is not None and (
+                old_clipboard == text
+                or len(old_clipboard) > self.max_restore_chars
+            ):
+                old_clipboard = None
+
+        our_seq = None
+        known = None
         try:
-            import pyperclip
-            clipboard_copy = pyperclip.copy
-            clipboard_paste = pyperclip.paste
-        except ImportError:
-            clipboard_copy = ClipboardFallback.copy
-            clipboard_paste = ClipboardFallback.paste
-
-        # Save current clipboard content
-        try:
-            old_clipboard = clipboard_paste()
-        except (RuntimeError, OSError):
-            old_clipboard = ""
-
-        try:
-            # Copy our text to clipboard
-            clipboard_copy(text)
-
-            # Small delay to ensure clipboard is ready
-            time.sleep(0.05)
+            # Copy our text to clipboard and wait until it has landed
+            _clipboard_copy(text)
+            _wait_for_clipboard_update(seq_before)
+            our_seq = _clipboard_sequence()
 
             # Press Ctrl+V
-            self._keyboard.press(Key.ctrl)
-            self._keyboard.press('v')
-            self._keyboard.release('v')
-            self._keyboard.release(Key.ctrl)
-
-            # Small delay before restoring clipboard
-            time.sleep(0.1)
+            kbd = self._kbd
+            press, release = kbd.press, kbd.release
+            press(Key.ctrl)
+            press('v')
+            release('v')
+            release(Key.ctrl)
+
+            if old_clipboard is not None:
+                # The paste is read asynchronously by the target app, with
+                # no signal when it is done, so give it a moment first
+                time.sleep(CLIPBOARD_RESTORE_DELAY)
 
         finally:
-            # Restore original clipboard content
-            try:
-                clipboard_copy(old_clipboard)
-            except (RuntimeError, OSError):
-                pass
+            # Restore original clipboard content, unless something else
+            # has written to the clipboard since our copy
+            unchanged = our_seq is not None and _clipboard_sequence() == our_seq
+            if old_clipboard is not None and (our_seq is None or unchanged):
+                try:
+                    _clipboard_copy(old_clipboard)
+                    known = old_clipboard
+                except (RuntimeError, OSError):
+                    pass
+            elif unchanged:
+                known = text
+
+            # Remember what we left on the clipboard for the next paste
+            self._known_clipboard = known
+            self._known_clipboard_seq = (
+                _clipboard_sequence() if known is not None else None
+            )
 
     def _type_characters(self, text: str) -> None:
         """Type text character by character."""
+        delay = self.typing_delay
+        if delay <= 0:
+            # No pacing needed, so send the whole string at once
+            self._type_batch(text)
+            return
+
+        type_ = self._kbd.type
+        sleep = time.sleep
         for char in text:
-            self._keyboard.type(char)
-            if self.typing_delay > 0:
-                time.sleep(self.typing_delay)
+            type_(char)
+            sleep(delay)
+
+    def _type_batch(self, text: str) -> None:
+        """Type a whole string, in a single SendInput call where available."""
+        if _user32 is not None and _send_input(_text_events(text)):
+            return
+        self._kbd.type(text)
 
     def press_key(self, key: Key) -> None:
         """Press and release a special key."""
-        self._keyboard.press(key)
-        self._keyboard.release(key)
+        kbd = self._kbd
+        kbd.press(key)
+        kbd.release(key)
 
     def press_enter(self) -> None:
         """Press the Enter key."""
@@ -108,8 +352,8 @@ class KeyboardTyper:
         if not word:
             return
         text = word + (" " if add_space else "")
-        # Use pynput's type() method - works from any thread
-        self._keyboard.type(text)
+        # Keystrokes rather than the clipboard - works from any thread
+        self._type_batch(text)
 
     def type_words(self, words: list, add_trailing_space: bool = True) -> None:
         """
@@ -127,15 +371,17 @@ class KeyboardTyper:
         text = " ".join(words)
         if add_trailing_space:
             text += " "
-        # Use pynput's type() method - works from any thread
-        self._keyboard.type(text)
+        # Keystrokes rather than the clipboard - works from any thread
+        self._type_batch(text)
 
     def delete_word(self) -> None:
         """Delete the previous word using Ctrl+Backspace."""
-        self._keyboard.press(Key.ctrl)
-        self._keyboard.press(Key.backspace)
-        self._keyboard.release(Key.backspace)
-        self._keyboard.release(Key.ctrl)
+        kbd = self._kbd
+        press, release = kbd.press, kbd.release
+        press(Key.ctrl)
+        press(Key.backspace)
+        release(Key.backspace)
+        release(Key.ctrl)
         time.sleep(0.02)  # Small delay for stability
 
     def delete_words(self, count: int) -> None:
@@ -147,8 +393,21 @@ class KeyboardTyper:
         Args:
             count: Number of words to delete.
         """
-        for _ in range(count):
-            self.delete_word()
+        if count <= 0:
+            return
+
+        # Hold Ctrl once and tap Backspace, with a single settle delay
+        kbd = self._kbd
+        press, release = kbd.press, kbd.release
+        backspace = Key.backspace
+        press(Key.ctrl)
+        try:
+            for _ in range(count):
+                press(backspace)
+                release(backspace)
+        finally:
+            release(Key.ctrl)
+        time.sleep(0.02)  # Small delay for stability
 
     def delete_characters(self, count: int) -> None:
         """
@@ -157,51 +416,242 @@ class KeyboardTyper:
         Args:
             count: Number of characters to delete.
         """
+        if count <= 0:
+            return
+
+        delay = self.typing_delay
+        if delay <= 0 and _user32 is not None:
+            # Every Backspace down/up pair in a single SendInput call
+            if _send_input([(VK_BACK, 0, 0), (VK_BACK, 0, KEYEVENTF_KEYUP)] * count):
+                return
+
+        kbd = self._kbd
+        press, release = kbd.press, kbd.release
+        backspace = Key.backspace
         for _ in range(count):
-            self._keyboard.press(Key.backspace)
-            self._keyboard.release(Key.backspace)
-            if self.typing_delay > 0:
-                time.sleep(self.typing_delay)
+            press(backspace)
+            release(backspace)
+            if delay > 0:
+                time.sleep(delay)
 
     def replace_words(self, old_words: list, new_words: list) -> None:
         """
         Replace old words with new words (for corrections).
 
-        Deletes the old words, then types the new words.
+        Words the two lists share at the start are left in place; only the
+        differing tail is deleted and retyped.
 
         Args:
             old_words: Words to delete (used to count deletions).
             new_words: Words to type in their place.
         """
-        if old_words:
-            self.delete_words(len(old_words))
-        if new_words:
-            self.type_words(new_words, add_trailing_space=True)
+        common = 0
+        limit = min(len(old_words), len(new_words))
+        while common < limit and old_words[common] == new_words[common]:
+            common += 1
+
+        if common < len(old_words):
+            self.delete_words(len(old_words) - common)
+        if common < len(new_words):
+            self.type_words(new_words[common:], add_trailing_space=True)
+
+
+def _text_events(text: str) -> List[Tuple[int, int, int]]:
+    """
+    Build the SendInput key events that type `text`.
+
+    Characters go in as Unicode, one key down/up per UTF-16 code unit, so
+    they don't depend on the keyboard layout. Newlines and tabs are sent as
+    Enter and Tab.
+
+    Args:
+        text: The text to type.
+
+    Returns:
+        List of (virtual key, scan code, flags) tuples.
+    """
+    events = []
+    append = events.append
+    up = KEYEVENTF_UNICODE | KEYEVENTF_KEYUP
+    for char in text:
+        vk = _CONTROL_VKS.get(char)
+        if vk is not None:
+            append((vk, 0, 0))
+            append((vk, 0, KEYEVENTF_KEYUP))
+            continue
+        code = ord(char)
+        if code > 0xFFFF:
+            # Outside the BMP: send as a surrogate pair
+            code -= 0x10000
+            units = (0xD800 + (code >> 10), 0xDC00 + (code & 0x3FF))
+        else:
+            units = (code,)
+        for unit in units:
+            append((0, unit, KEYEVENTF_UNICODE))
+            append((0, unit, up))
+    return events
+
+
+def _send_input(events: List[Tuple[int, int, int]]) -> int:
+    """
+    Inject keyboard events with a single SendInput call.
+
+    Args:
+        events: (virtual key, scan code, flags) tuples, in order.
+
+    Returns:
+        Number of events injected. 0 means none were, e.g. because input to
+        the target window is blocked, and the caller may retry another way.
+    """
+    count = len(events)
+    if not count:
+        return 0
+
+    inputs = (_INPUT * count)()
+    for inp, (vk, scan, flags) in zip(inputs, events):
+        inp.type = INPUT_KEYBOARD
+        inp.ki.wVk = vk
+        inp.ki.wScan = scan
+        inp.ki.dwFlags = flags
+
+    sent = _user32.SendInput(count, inputs, ctypes.sizeof(_INPUT))
+    if 0 < sent < count:
+        log.warning("SendInput injected only %d of %d key events", sent, count)
+    return sent
+
+
+def get_foreground_window() -> Optional[int]:
+    """
+    Get the handle of the current foreground window.
+
+    Returns:
+        The window handle on Windows, or None on other platforms.
+    """
+    if _user32 is None:
+        return None
+
+    return _user32.GetForegroundWindow()
+
+
+def wait_for_foreground(hwnd: Optional[int], timeout: float = 0.1) -> None:
+    """
+    Wait until the given window is in the foreground again.
+
+    Returns as soon as it is, so typing can start the moment focus is back.
+    Falls back to simply sleeping for `timeout` where the foreground window
+    can't be queried.
+
+    Args:
+        hwnd: Window handle from get_foreground_window(), or None.
+        timeout: Maximum time to wait in seconds.
+    """
+    if hwnd is None:
+        time.sleep(timeout)
+        return
+
+    deadline = time.monotonic() + timeout
+    while get_foreground_window() != hwnd:
+        if time.monotonic() >= deadline:
+            return
+        time.sleep(0.005)
+
+
+def _clipboard_sequence() -> Optional[int]:
+    """
+    Get the Windows clipboard sequence number.
+
+    Returns:
+        The current sequence number, or None on other platforms.
+    """
+    if _user32 is None:
+        return None
+    return _user32.GetClipboardSequenceNumber()
+
+
+def _wait_for_clipboard_update(
+    seq_before: Optional[int],
+    timeout: float = CLIPBOARD_READY_TIMEOUT
+) -> None:
+    """
+    Wait until the clipboard has changed since `seq_before`.
+
+    Returns as soon as the sequence number moves on, which for a
+    synchronous copy is usually immediately. Falls back to simply sleeping
+    for `timeout` where the sequence number isn't available.
+
+    Args:
+        seq_before: Sequence number from _clipboard_sequence(), or None.
+        timeout: Maximum time to wait in seconds.
+    """
+    if seq_before is None:
+        time.sleep(timeout)
+        return
+
+    deadline = time.monotonic() + timeout
+    while _user32.GetClipboardSequenceNumber() == seq_before:
+        if time.monotonic() >= deadline:
+            return
+        time.sleep(0.001)
+
+
+def _open_clipboard(attempts: int = CLIPBOARD_OPEN_ATTEMPTS) -> bool:
+    """
+    Open the Windows clipboard, retrying while another process holds it.
+
+    Args:
+        attempts: Maximum number of OpenClipboard calls.
+
+    Returns:
+        True if the clipboard is now open (and must be closed by the caller).
+    """
+    for attempt in range(attempts):
+        if _user32.OpenClipboard(None):
+            return True
+        if attempt < attempts - 1:
+            time.sleep(0.001 * (1 << attempt))
+    return False
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_utf16(text: str) -> bytes:
+    """
+    Encode text as UTF-16LE for the Windows clipboard.
+
+    Cached, since streaming and retries tend to copy the same short strings
+    again.
+
+    Args:
+        text: Text to encode.
+
+    Returns:
+        The encoded text, without a terminator.
+    """
+    return text.encode('utf-16-le')
 
 
 class ClipboardFallback:
     """
-    Fallback clipboard implementation if pyperclip isn't available.
-    Uses Windows-native ctypes calls.
+    Windows clipboard implementation using native ctypes calls.
+    Always used on Windows; pyperclip covers other platforms.
     """
 
     @staticmethod
     def copy(text: str) -> None:
         """Copy text to Windows clipboard using ctypes."""
-        import ctypes
-        from ctypes import wintypes
-
         CF_UNICODETEXT = 13
         GMEM_MOVEABLE = 0x0002
+        GMEM_ZEROINIT = 0x0040
 
-        user32 = ctypes.windll.user32
-        kernel32 = ctypes.windll.kernel32
+        user32 = _user32
+        kernel32 = _kernel32
 
-        # Convert to wide string
-        text_bytes = (text + '\0').encode('utf-16-le')
+        # Convert to wide string; the NUL terminator comes from the
+        # zero-initialized allocation below rather than a copied string
+        text_bytes = _encode_utf16(text)
+        size = len(text_bytes) + 2
 
         # Open clipboard
-        if not user32.OpenClipboard(None):
+        if not _open_clipboard():
             raise RuntimeError("Cannot open clipboard")
 
         try:
@@ -209,8 +659,8 @@ class ClipboardFallback:
 
             # Allocate global memory
             h_mem = kernel32.GlobalAlloc(
-                GMEM_MOVEABLE,
-                len(text_bytes)
+                GMEM_MOVEABLE | GMEM_ZEROINIT,
+                size
             )
             if not h_mem:
                 raise RuntimeError("GlobalAlloc failed")
@@ -233,41 +683,55 @@ class ClipboardFallback:
             user32.CloseClipboard()
 
     @staticmethod
-    def paste() -> str:
-        """Get text from Windows clipboard using ctypes."""
-        import ctypes
+    def paste() -> Optional[str]:
+        """
+        Get text from Windows clipboard using ctypes.
 
+        Returns:
+            The clipboard text ("" if it is genuinely empty text), or None if
+            it couldn't be read: the clipboard is locked by another process,
+            holds no text (e.g. an image or file list), or can't be accessed.
+        """
         CF_UNICODETEXT = 13
 
-        user32 = ctypes.windll.user32
-        kernel32 = ctypes.windll.kernel32
+        user32 = _user32
+        kernel32 = _kernel32
 
-        if not user32.OpenClipboard(None):
-            return ""
+        if not _open_clipboard():
+            return None
 
+        p_mem = None
         try:
             h_mem = user32.GetClipboardData(CF_UNICODETEXT)
             if not h_mem:
-                return ""
+                return None
 
             p_mem = kernel32.GlobalLock(h_mem)
             if not p_mem:
-                return ""
+                return None
 
-            try:
-                text = ctypes.wstring_at(p_mem)
-                return text
-            finally:
-                kernel32.GlobalUnlock(h_mem)
+            # Read a known length rather than scanning for the terminator,
+            # then drop the terminator and anything after it
+            size = kernel32.GlobalSize(h_mem)
+            text = ctypes.wstring_at(p_mem, size // 2)
+            end = text.find('\0')
+            return text if end < 0 else text[:end]
 
         finally:
+            if p_mem:
+                kernel32.GlobalUnlock(h_mem)
             user32.CloseClipboard()
 
 
+# Clipboard backend for pasting, picked once at import
+if pyperclip is not None:
+    _clipboard_copy, _clipboard_paste = pyperclip.copy, pyperclip.paste
+else:
+    _clipboard_copy, _clipboard_paste = ClipboardFallback.copy, ClipboardFallback.paste
+
+
 if __name__ == "__main__":
     # Quick test
-    import time
-
     print("Testing keyboard typer...")
     print("You have 3 seconds to click on a text field...")
     time.sleep(3)
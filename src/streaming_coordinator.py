@@ -157,12 +157,9 @@ class StreamingCoordinator:
             with self._typed_words_lock:
                 self._typed_words.clear()
 
-            # Clear queues
-            while not self._word_queue.empty():
-                try:
-                    self._word_queue.get_nowait()
-                except queue.Empty:
-                    break
+            # Clear queues in one go rather than one locked get() per item
+            with self._word_queue.mutex:
+                self._word_queue.queue.clear()
 
             # Reset stats
             self._stats = StreamingStats(start_time=time.time())
@@ -227,7 +224,9 @@ class StreamingCoordinator:
         Args:
             audio_chunk: numpy array of audio data
         """
-        if self.state == StreamingState.STREAMING:
+        # Called for every audio chunk, so read the state without taking the
+        # lock; a stale read at most drops or admits one chunk at a transition.
+        if self._state is StreamingState.STREAMING:
             self._transcriber.feed_audio(audio_chunk)
 
     def is_active(self) -> bool:
@@ -259,25 +258,37 @@ class StreamingCoordinator:
             try:
                 # Get word from queue with timeout
                 try:
-                    word = self._word_queue.get(timeout=0.1)
+                    words = [self._word_queue.get(timeout=0.1)]
                 except queue.Empty:
                     continue
 
-                # Process through text processor if available
-                processed_word = word
-                if self._text_processor:
+                # Take whatever else has already arrived, so a burst of
+                # confirmed words is typed in one go
+                while True:
                     try:
-                        processed_word = self._process_word(word)
-                        if processed_word is None:
-                            # Word was a command that was executed
-                            continue
-                    except Exception as e:
-                        print(f"Text processor error: {e}")
-                        processed_word = word
+                        words.append(self._word_queue.get_nowait())
+                    except queue.Empty:
+                        break
 
-                # Type the word
-                if processed_word:
-                    self._type_word(processed_word)
+                # Process through text processor if available
+                to_type = []
+                for word in words:
+                    processed_word = word
+                    if self._text_processor:
+                        try:
+                            processed_word = self._process_word(word)
+                            if processed_word is None:
+                                # Word was a command that was executed
+                                continue
+                        except Exception as e:
+                            print(f"Text processor error: {e}")
+                            processed_word = word
+                    if processed_word:
+                        to_type.append(processed_word)
+
+                # Type the words
+                if to_type:
+                    self._type_words(to_type)
 
             except Exception as e:
                 self._stats.errors += 1
@@ -295,21 +306,22 @@ class StreamingCoordinator:
         # For now, return word as-is
         return word
 
-    def _type_word(self, word: str) -> None:
-        """Type a single word and track it."""
+    def _type_words(self, words: List[str]) -> None:
+        """Type a batch of words, each followed by a space, and track them."""
         try:
-            self._typer.type_word(word, add_space=True)
+            self._typer.type_words(words, add_trailing_space=True)
 
             with self._typed_words_lock:
-                self._typed_words.append(word)
+                self._typed_words.extend(words)
 
-            self._stats.words_typed += 1
+            self._stats.words_typed += len(words)
 
             if self._on_word_typed:
-                try:
-                    self._on_word_typed(word)
-                except Exception as e:
-                    print(f"Word typed callback error: {e}")
+                for word in words:
+                    try:
+                        self._on_word_typed(word)
+                    except Exception as e:
+                        print(f"Word typed callback error: {e}")
 
         except Exception as e:
             self._stats.errors += 1
@@ -14,8 +14,10 @@ import threading
 import queue
 import time
 from dataclasses import dataclass, field
-from typing import Optional, List, Tuple, Generator, Callable, Any
-from faster_whisper import WhisperModel
+from typing import Optional, List, Tuple, Generator, Callable, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
 
 
 @dataclass
@@ -61,8 +63,10 @@ class AudioRingBuffer:
 
     def append(self, audio: np.ndarray) -> None:
         """Append audio data to the buffer."""
+        # View as flat float32; no copy for the recorder's mono float32 chunks
+        audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+
         with self._lock:
-            audio = audio.flatten().astype(np.float32)
             n_samples = len(audio)
 
             if n_samples >= self.max_samples:
@@ -208,7 +212,7 @@ class StreamingTranscriber:
 
     def __init__(
         self,
-        model: WhisperModel,
+        model: "WhisperModel",
         chunk_duration: float = 1.0,
         buffer_duration: float = 5.0,
         agreement_threshold: int = 2,
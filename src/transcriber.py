@@ -3,9 +3,15 @@ Whisper transcription module using faster-whisper.
 Handles model loading and audio-to-text conversion.
 """
 
-from faster_whisper import WhisperModel
-from typing import Optional, Literal
+from typing import Optional, Literal, Union, TYPE_CHECKING
 import os
+import threading
+
+if TYPE_CHECKING:
+    # faster-whisper pulls in ctranslate2 and its backend DLLs, so the real
+    # import is deferred to load_model()
+    import numpy as np
+    from faster_whisper import WhisperModel
 
 
 # Model size options (larger = more accurate but slower)
@@ -35,59 +41,92 @@ class Transcriber:
             compute_type: "float16", "int8", "float32", or "auto"
         """
         self.model_size = model_size
-        self._model: Optional[WhisperModel] = None
+        self._model: Optional["WhisperModel"] = None
         self._device = device
         self._compute_type = compute_type
+        self._load_lock = threading.Lock()
 
     def load_model(self) -> None:
-        """Load the Whisper model. Called automatically on first transcription."""
+        """
+        Load the Whisper model. Called automatically on first transcription.
+
+        Safe to call from several threads: callers that arrive while a load
+        is in progress (e.g. the background preload) wait for it to finish.
+        """
         if self._model is not None:
             return
 
-        print(f"Loading Whisper model '{self.model_size}'...")
+        with self._load_lock:
+            if self._model is not None:
+                return
 
-        # Determine device (default to CPU for reliability)
-        device = "cpu" if self._device == "auto" else self._device
+            from faster_whisper import WhisperModel
 
-        # Determine compute type based on device
-        if self._compute_type == "auto":
-            compute_type = "int8" if device == "cpu" else "float16"
-        else:
-            compute_type = self._compute_type
+            print(f"Loading Whisper model '{self.model_size}'...")
 
-        self._model = WhisperModel(
-            self.model_size,
-            device=device,
-            compute_type=compute_type
-        )
-        print("Model loaded successfully!")
+            # Determine device (default to CPU for reliability)
+            device = "cpu" if self._device == "auto" else self._device
+
+            # Determine compute type based on device
+            if self._compute_type == "auto":
+                compute_type = "int8" if device == "cpu" else "float16"
+            else:
+                compute_type = self._compute_type
+
+            self._model = WhisperModel(
+                self.model_size,
+                device=device,
+                compute_type=compute_type
+            )
+            print("Model loaded successfully!")
+
+    def warm_up(self) -> None:
+        """
+        Run a short silent transcription to initialize the inference backend.
+
+        The first call into a freshly loaded model is noticeably slower than
+        the rest; doing it here keeps that cost off the first real recording.
+        """
+        self.load_model()
+
+        import numpy as np
+
+        silence = np.zeros(16000, dtype=np.float32)  # 1 second at 16kHz
+        try:
+            segments, _ = self._model.transcribe(silence, beam_size=1, language="en")
+            # Segments are generated lazily; consume them to actually run
+            for _ in segments:
+                pass
+        except Exception as e:
+            print(f"Model warm-up failed: {e}")
 
     def transcribe(
         self,
-        audio_path: str,
+        audio: Union[str, "np.ndarray"],
         language: Optional[str] = None,
         task: Literal["transcribe", "translate"] = "transcribe"
     ) -> str:
         """
-        Transcribe an audio file to text.
+        Transcribe audio to text.
 
         Args:
-            audio_path: Path to the audio file (WAV, MP3, etc.)
+            audio: Path to an audio file (WAV, MP3, etc.), or a 1-D float32
+                   array of 16 kHz mono samples (no decoding needed).
             language: Language code (e.g., "en", "es"). None = auto-detect.
             task: "transcribe" for same-language, "translate" to English.
 
         Returns:
             Transcribed text as a string.
         """
-        if not os.path.exists(audio_path):
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        if isinstance(audio, str) and not os.path.exists(audio):
+            raise FileNotFoundError(f"Audio file not found: {audio}")
 
         # Lazy load the model
         self.load_model()
 
         # Transcribe
         segments, info = self._model.transcribe(
-            audio_path,
+            audio,
             language=language,
             task=task,
             beam_size=5,
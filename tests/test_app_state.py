@@ -0,0 +1,113 @@
+"""
+Tests for STTApp's recording state transitions.
+
+The app is assembled without its real components (microphone, Whisper,
+keyboard hooks, Tk), so only the state handling itself is exercised.
+"""
+
+import os
+import sys
+import threading
+import unittest
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app import STTApp  # noqa: E402
+
+
+class FakeRecorder:
+    """Records start/stop calls; discard() can be made to block."""
+
+    def __init__(self):
+        self.calls = []
+        self.recording = False
+        self.stop_entered = threading.Event()
+        self.stop_release = threading.Event()
+        self.stop_release.set()
+
+    def set_on_chunk(self, callback):
+        pass
+
+    def start(self):
+        self.calls.append("start")
+        self.recording = True
+
+    def discard(self):
+        self.stop_entered.set()
+        self.stop_release.wait(timeout=5.0)
+        self.calls.append("stop")
+        self.recording = False
+
+
+class FakeGui:
+    STATE_IDLE = "idle"
+    STATE_RECORDING = "recording"
+
+    def set_state(self, state):
+        pass
+
+    def update_title(self, title):
+        pass
+
+    def notify(self, title, message):
+        pass
+
+
+def make_app(recorder):
+    """Build an STTApp with only what start/cancel recording touch."""
+    app = STTApp.__new__(STTApp)
+    app._lock = threading.Lock()
+    app._state = STTApp._IDLE
+    app._streaming_mode = False
+    app._streaming_coordinator = None
+    app._cfg = SimpleNamespace(enable_streaming=False, show_notifications=False)
+    app.recorder = recorder
+    app.gui = FakeGui()
+    return app
+
+
+class CancelStartInterleavingTest(unittest.TestCase):
+
+    def test_start_during_cancel_keeps_new_capture(self):
+        recorder = FakeRecorder()
+        app = make_app(recorder)
+
+        app.start_recording()
+        self.assertEqual(recorder.calls, ["start"])
+
+        # Hold cancel inside discard() while a new start comes in
+        recorder.calls.clear()
+        recorder.stop_release.clear()
+        canceller = threading.Thread(target=app.cancel_recording)
+        canceller.start()
+        self.assertTrue(recorder.stop_entered.wait(timeout=5.0))
+
+        starter = threading.Thread(target=app.start_recording)
+        starter.start()
+        starter.join(timeout=0.1)
+
+        recorder.stop_release.set()
+        canceller.join(timeout=5.0)
+        starter.join(timeout=5.0)
+
+        # The cancel's stop must land before the new capture starts, and
+        # must not tear that capture down
+        self.assertEqual(recorder.calls, ["stop", "start"])
+        self.assertTrue(recorder.recording)
+        self.assertEqual(app._state, STTApp._RECORDING)
+
+    def test_cancel_returns_to_idle(self):
+        recorder = FakeRecorder()
+        app = make_app(recorder)
+
+        app.start_recording()
+        app.cancel_recording()
+
+        self.assertEqual(recorder.calls, ["start", "stop"])
+        self.assertFalse(recorder.recording)
+        self.assertEqual(app._state, STTApp._IDLE)
+
+
+if __name__ == "__main__":
+    unittest.main()